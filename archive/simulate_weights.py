@@ -19,6 +19,9 @@ Usage:
     --season 2025 \
     --train-ratio 0.75
 
+  # Optional: AOT-compile the numba kernel once to skip JIT on later runs
+  python3 simulate_weights.py --build-kernels
+
   # Focused simulation (only optimize specific factors)
   python3 simulate_weights.py \
     --start-date 2025-12-15 \
@@ -27,9 +30,19 @@ Usage:
     --optimize form_multiplier pace_fast pace_slow \
     --fix-all-others
 
+  # Full grid over the optimized factors, pruned by successive halving
+  python3 simulate_weights.py \
+    --start-date 2025-12-15 \
+    --end-date 2025-12-20 \
+    --season 2025 \
+    --optimize form_multiplier pace_fast pace_slow \
+    --grid --halving
+
 Requirements:
   - env var `BALLDONTLIE_API_KEY` must be set.
-  - numpy (optional, for faster Monte Carlo sampling)
+  - numpy (records are scored as vectorized struct-of-arrays)
+  - numba (optional, compiled per-config evaluation kernel)
+  - orjson (optional, faster JSON output)
   
 Parallel Processing:
   - Automatically uses all available CPU cores (CPU count - 1)
@@ -42,12 +55,12 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import random
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, fields
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import multiprocessing
 
 # Load .env file if it exists
@@ -58,11 +71,19 @@ if os.path.exists(".env"):
                 key, value = line.strip().split("=", 1)
                 os.environ[key] = value.strip("'").strip('"')
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 try:
-    import numpy as np
-    HAS_NUMPY = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_NUMPY = False
+    HAS_ORJSON = False
 
 # Import from auto_tune_model
 from auto_tune_model import (
@@ -80,6 +101,17 @@ MIN_MAE_IMPROVEMENT = 0.2  # Must improve MAE by at least 0.2 pts
 MIN_BIAS_IMPROVEMENT = 0.3  # Must improve bias by at least 0.3 pts
 MIN_WITHIN_5_IMPROVEMENT = 2.0  # Must improve % within 5 pts by at least 2%
 
+# Configs evaluated per batched call; bounds the (N, K) prediction matrices
+CONFIG_BATCH_SIZE = 256
+
+# Threads used to fetch historical days concurrently (network-bound)
+FETCH_WORKERS = 8
+
+# int8 codes for dvp_bucket in the SoA (unlisted buckets, e.g. AVERAGE, are neutral)
+DVP_CODE = {"NEUTRAL": 0, "WEAK": 1, "STRONG": 2}
+DVP_WEAK = DVP_CODE["WEAK"]
+DVP_STRONG = DVP_CODE["STRONG"]
+
 
 @dataclass
 class WeightConfig:
@@ -130,6 +162,32 @@ class WeightConfig:
         return cls()  # Uses defaults which match current prompt
 
 
+# Candidate values for each factor during Monte Carlo sampling
+SEARCH_SPACES: Dict[str, Tuple[float, ...]] = {
+    "form_multiplier": (4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5),
+    "form_cap": (2.0, 2.2, 2.4, 2.6, 2.8),
+    "pace_fast": (1.2, 1.5, 1.8, 2.0, 2.2, 2.5),
+    "pace_slow": (-1.2, -1.5, -1.8, -2.0, -2.2, -2.5),
+    "usage_high": (0.8, 1.0, 1.2, 1.4, 1.6),
+    "usage_low": (-0.6, -0.8, -1.0, -1.2),
+    "rest_b2b_road": (-1.5, -2.0, -2.5, -3.0),
+    "rest_b2b_home": (-1.0, -1.2, -1.5, -1.8),
+    "rest_optimal": (0.2, 0.3, 0.4, 0.5, 0.6),
+    "rest_rust": (-0.2, -0.3, -0.4, -0.5),
+    "dvp_weak": (1.5, 2.0, 2.5),
+    "dvp_strong": (-1.5, -2.0, -2.5),
+    "minutes_high": (1.5, 2.0, 2.5),
+    "minutes_med": (0.8, 1.0, 1.2),
+    "minutes_low": (-2.5, -3.0, -3.5),
+    "consistency_stable": (1.2, 1.5, 1.8),
+    "consistency_volatile": (-1.2, -1.5, -1.8),
+}
+
+# Weight slots in WeightConfig field order. form_multiplier/form_cap shape the
+# (non-linear) form term; every other weight is added when its indicator is set.
+WEIGHT_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(WeightConfig))
+
+
 @dataclass
 class SimulationResult:
     """Result of testing a weight configuration."""
@@ -140,167 +198,438 @@ class SimulationResult:
     rank: int = 0
 
 
-def compute_adjustment_score_with_weights(
-    record: PlayerGameRecord,
-    weights: WeightConfig,
-) -> float:
+def weights_to_array(config: WeightConfig) -> np.ndarray:
+    """Weight vector for a config, in WEIGHT_NAMES order."""
+    return np.array([getattr(config, name) for name in WEIGHT_NAMES], dtype=np.float64)
+
+
+def weights_from_array(w: np.ndarray) -> Dict[str, float]:
+    """Name -> value dict for a weight vector in WEIGHT_NAMES order."""
+    return dict(zip(WEIGHT_NAMES, w.tolist()))
+
+
+def _indicator_matrix(soa: Dict[str, np.ndarray]) -> np.ndarray:
     """
-    Compute adjustment score using custom weights.
-    This replaces the hardcoded logic in auto_tune_model.py.
+    (N, F-2) 0/1 matrix with one column per linear weight (WEIGHT_NAMES[2:]),
+    so the linear part of the adjustment score is indicators @ W[:, 2:].T.
     """
-    score = 0.0
-    
-    # Form adjustment
-    if record.season_pts_avg > 0:
-        form_raw = ((record.l5_pts_avg - record.season_pts_avg) / record.season_pts_avg) * weights.form_multiplier
-        score += max(-weights.form_cap, min(weights.form_cap, form_raw))
-    
-    # Pace adjustment
-    if record.pace_env > 104:
-        score += weights.pace_fast
-    elif record.pace_env < 99:
-        score += weights.pace_slow
-    
-    # Usage adjustment
-    if record.usg_pct is not None:
-        if record.usg_pct >= 28.0:
-            score += weights.usage_high
-        elif record.usg_pct < 20.0:
-            score += weights.usage_low
-    
-    # Rest adjustment
-    if record.days_rest == 0:  # B2B
-        score += weights.rest_b2b_road if not record.is_home else weights.rest_b2b_home
-    elif record.days_rest == 2:
-        score += weights.rest_optimal
-    elif record.days_rest >= 3:
-        score += weights.rest_rust
-    
-    # DvP adjustment
-    if record.dvp_bucket == "WEAK":
-        score += weights.dvp_weak
-    elif record.dvp_bucket == "STRONG":
-        score += weights.dvp_strong
-    
-    # Minutes adjustment
-    proj_minutes = record.l5_minutes_avg if record.l5_minutes_avg > 0 else record.season_minutes_avg
-    if proj_minutes >= 34:
-        score += weights.minutes_high
-    elif proj_minutes >= 30:
-        score += weights.minutes_med
-    elif proj_minutes < 26:
-        score += weights.minutes_low
-    
-    # Consistency adjustment
-    if record.l5_pts_stdev <= 5:
-        score += weights.consistency_stable
-    elif record.l5_pts_stdev > 7:
-        score += weights.consistency_volatile
+    pace_env = soa["pace_env"]
+    usg = soa["usg_pct"]  # NaN compares False, so missing usage adds nothing
+    days_rest = soa["days_rest"]
+    is_home = soa["is_home"]
+    dvp = soa["dvp_code"]
+    proj_minutes = soa["proj_minutes"]
+    stdev = soa["l5_pts_stdev"]
+    
+    return np.column_stack((
+        pace_env > 104,
+        pace_env < 99,
+        usg >= 28.0,
+        usg < 20.0,
+        (days_rest == 0) & ~is_home,
+        (days_rest == 0) & is_home,
+        days_rest == 2,
+        days_rest >= 3,
+        dvp == DVP_WEAK,
+        dvp == DVP_STRONG,
+        proj_minutes >= 34,
+        (proj_minutes >= 30) & (proj_minutes < 34),
+        proj_minutes < 26,
+        stdev <= 5,
+        stdev > 7,
+    )).astype(np.float64)
+
+
+def records_to_soa(records: List[PlayerGameRecord]) -> Dict[str, np.ndarray]:
+    """
+    Convert records into a struct-of-arrays (one array per field).
+    Missing usage is stored as NaN; dvp_bucket is encoded via DVP_CODE.
+    Also precomputes the form ratio and the indicator matrix used by the
+    batched evaluator.
+    """
+    soa = {
+        "season_pts_avg": np.array([r.season_pts_avg for r in records], dtype=np.float64),
+        "l5_pts_avg": np.array([r.l5_pts_avg for r in records], dtype=np.float64),
+        "pace_env": np.array([r.pace_env for r in records], dtype=np.float64),
+        "usg_pct": np.array(
+            [np.nan if r.usg_pct is None else r.usg_pct for r in records], dtype=np.float64
+        ),
+        "days_rest": np.array([r.days_rest for r in records], dtype=np.int64),
+        "is_home": np.array([bool(r.is_home) for r in records], dtype=np.bool_),
+        "dvp_code": np.array([DVP_CODE.get(r.dvp_bucket, 0) for r in records], dtype=np.int8),
+        # L5 minutes when available, else season minutes
+        "proj_minutes": np.array(
+            [r.l5_minutes_avg if r.l5_minutes_avg > 0 else r.season_minutes_avg for r in records],
+            dtype=np.float64,
+        ),
+        "l5_pts_stdev": np.array([r.l5_pts_stdev for r in records], dtype=np.float64),
+        "baseline_proj": np.array([r.baseline_proj for r in records], dtype=np.float64),
+        "actual_pts": np.array([r.actual_pts for r in records], dtype=np.float64),
+    }
     
+    # Fractional form vs season average (0 when there is no season average),
+    # so the form term is clip(form_ratio * form_multiplier, ±form_cap)
+    season = soa["season_pts_avg"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        soa["form_ratio"] = np.where(season > 0, (soa["l5_pts_avg"] - season) / season, 0.0)
+    soa["indicators"] = _indicator_matrix(soa)
+    return soa
+
+
+def compute_adjustment_score_with_weights(
+    soa: Dict[str, np.ndarray],
+    W: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute (N, K) adjustment scores for every record under each of the K
+    weight rows in W. This replaces the hardcoded logic in auto_tune_model.py.
+    """
+    form_multiplier, form_cap = W[:, 0], W[:, 1]
+    score = soa["form_ratio"][:, None] * form_multiplier
+    np.clip(score, -form_cap, form_cap, out=score)
+    score += soa["indicators"] @ W[:, 2:].T
     return score
 
 
 def compute_predictions_with_weights(
-    records: List[PlayerGameRecord],
-    weights: WeightConfig,
-) -> List[Tuple[float, float]]:
+    soa: Dict[str, np.ndarray],
+    W: np.ndarray,
+) -> np.ndarray:
+    """Compute (N, K) projected points for every record under each weight row."""
+    baseline_pts = soa["baseline_proj"][:, None]
+    
+    # Convert to percentage adjustment (clamped to ±15%)
+    adj_pct = compute_adjustment_score_with_weights(soa, W)
+    adj_pct /= 40.0
+    np.clip(adj_pct, -0.15, 0.15, out=adj_pct)
+    
+    # Final projection
+    adj_proj_pts = baseline_pts * (1.0 + adj_pct)
+    
+    # Sanity rules: no upside bump under 26 projected minutes
+    low_minutes = soa["proj_minutes"] < 26
+    adj_proj_pts[low_minutes] = np.minimum(adj_proj_pts[low_minutes], baseline_pts[low_minutes])
+    
+    return adj_proj_pts
+
+
+def _error_metrics(pred: np.ndarray, actual: np.ndarray) -> Dict[str, np.ndarray]:
     """
-    Compute predictions for all records using custom weights.
-    Returns list of (predicted_pts, actual_pts) tuples.
+    Per-config (K,) MAE, RMSE, bias and % within 5 pts for (N, K) predictions.
+    Works in place on pred to avoid (N, K) temporaries.
     """
-    predictions = []
-    
-    for record in records:
-        # Baseline projection (season average)
-        baseline_pts = record.baseline_proj
-        
-        # Compute adjustment score
-        adj_score = compute_adjustment_score_with_weights(record, weights)
-        
-        # Convert to percentage adjustment (clamped to ±15%)
-        adj_pct = max(-0.15, min(0.15, adj_score / 40.0))
-        
-        # Final projection
-        adj_proj_pts = baseline_pts * (1.0 + adj_pct)
-        
-        # Sanity rules
-        proj_minutes = record.l5_minutes_avg if record.l5_minutes_avg > 0 else record.season_minutes_avg
-        if proj_minutes < 26:
-            adj_proj_pts = min(adj_proj_pts, baseline_pts)  # No upside bump
-        
-        predictions.append((adj_proj_pts, record.actual_pts))
-    
-    return predictions
-
-
-def _evaluate_config_worker(args: Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]) -> Dict[str, Any]:
+    n, k = pred.shape
+    if n == 0:
+        zeros = np.zeros(k)
+        return {"mae": zeros, "rmse": zeros, "bias": zeros, "within_5_pts_pct": zeros}
+    
+    errors = pred
+    errors -= actual[:, None]
+    bias = errors.mean(axis=0)
+    rmse = np.sqrt(np.einsum("nk,nk->k", errors, errors) / n)
+    abs_errors = np.abs(errors, out=errors)
+    return {
+        "mae": abs_errors.mean(axis=0),
+        "rmse": rmse,
+        "bias": bias,
+        "within_5_pts_pct": np.count_nonzero(abs_errors <= 5, axis=0) / n * 100,
+    }
+
+
+def _make_metrics_dict(metrics: Dict[str, np.ndarray], i: int, n_players: int) -> Dict[str, Any]:
+    """Rounded reporting dict for config i."""
+    return {
+        "mae": round(float(metrics["mae"][i]), 3),
+        "rmse": round(float(metrics["rmse"][i]), 3),
+        "bias": round(float(metrics["bias"][i]), 3),
+        "within_5_pts_pct": round(float(metrics["within_5_pts_pct"][i]), 2),
+        "n_players": n_players,
+    }
+
+
+def evaluate_split(W: np.ndarray, soa: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
     """
-    Worker function for parallel evaluation.
-    Converts dicts back to objects, evaluates, returns dict.
+    Evaluate every weight row of W (K, F) on one set of records.
+    Returns a dict of (K,) metric arrays. Uses the numba kernel when
+    available, else batched numpy.
     """
-    config_dict, train_records_dicts, validation_records_dicts = args
+    if HAS_NUMBA:
+        return _evaluate_numba(W, soa)
     
-    # Reconstruct objects
-    config = WeightConfig.from_dict(config_dict)
-    train_records = [PlayerGameRecord(**r) for r in train_records_dicts]
-    validation_records = [PlayerGameRecord(**r) for r in validation_records_dicts]
+    parts = [
+        _error_metrics(compute_predictions_with_weights(soa, W[lo:lo + CONFIG_BATCH_SIZE]), soa["actual_pts"])
+        for lo in range(0, len(W), CONFIG_BATCH_SIZE)
+    ]
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+def evaluate_weight_matrix(
+    W: np.ndarray,
+    train_soa: Dict[str, np.ndarray],
+    validation_soa: Dict[str, np.ndarray],
+) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Evaluate every weight row of W (K, F) on the train and validation sets.
+    Returns (train_metrics, validation_metrics), each a dict of (K,) arrays.
+    """
+    return evaluate_split(W, train_soa), evaluate_split(W, validation_soa)
+
+
+def run_halving(
+    W: np.ndarray,
+    soa: Dict[str, np.ndarray],
+    factor: int = 3,
+    min_records: int = 500,
+    min_survivors: int = 10,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Successive halving over the rows of W.
+    Scores the surviving configs on a random subsample of records, keeps the
+    best 1/factor (by MAE, then |bias|), grows the subsample by factor and
+    repeats until it covers every record or min_survivors remain.
+    Returns the sorted row indices of the survivors.
+    """
+    rng = rng or np.random.default_rng()
+    n = len(soa["actual_pts"])
+    survivors = np.arange(len(W))
+    resource = min_records
+    
+    while resource < n and len(survivors) > min_survivors:
+        rows = rng.choice(n, size=resource, replace=False)
+        metrics = evaluate_split(W[survivors], {key: col[rows] for key, col in soa.items()})
+        order = np.lexsort((np.abs(metrics["bias"]), metrics["mae"]))
+        keep = max(min_survivors, len(survivors) // factor)
+        survivors = np.sort(survivors[order[:keep]])
+        resource *= factor
+    
+    return survivors
+
+
+# Signature of the ahead-of-time eval_kernel export (see build_kernels)
+_EVAL_KERNEL_SIGNATURE = (
+    "Tuple((f8, f8, f8, i8))(f8[:], f8[:], f8[:], f8[:], f8[:], i8[:], b1[:], i1[:], f8[:], f8[:], f8[:], f8[:])"
+)
+
+if HAS_NUMBA:
+    def _eval_kernel_impl(
+        w,
+        season,
+        l5,
+        pace_env,
+        usg,
+        days_rest,
+        is_home,
+        dvp_code,
+        proj_minutes,
+        stdev,
+        baseline,
+        actual,
+    ):
+        """
+        Score every record under one weight row (WEIGHT_NAMES order) and
+        return (sum_abs_err, sum_err, sum_sq_err, n_within_5).
+        """
+        (form_multiplier, form_cap, pace_fast, pace_slow, usage_high, usage_low,
+         rest_b2b_road, rest_b2b_home, rest_optimal, rest_rust, dvp_weak, dvp_strong,
+         minutes_high, minutes_med, minutes_low, consistency_stable,
+         consistency_volatile) = (
+            w[0], w[1], w[2], w[3], w[4], w[5], w[6], w[7], w[8],
+            w[9], w[10], w[11], w[12], w[13], w[14], w[15], w[16],
+        )
+        sum_abs = 0.0
+        sum_err = 0.0
+        sum_sq = 0.0
+        within_5 = 0
+        for i in prange(season.shape[0]):
+            score = 0.0
+            
+            if season[i] > 0:
+                form_raw = ((l5[i] - season[i]) / season[i]) * form_multiplier
+                score += max(-form_cap, min(form_cap, form_raw))
+            
+            if pace_env[i] > 104:
+                score += pace_fast
+            elif pace_env[i] < 99:
+                score += pace_slow
+            
+            # Missing usage is NaN and fails both comparisons
+            if usg[i] >= 28.0:
+                score += usage_high
+            elif usg[i] < 20.0:
+                score += usage_low
+            
+            if days_rest[i] == 0:
+                score += rest_b2b_home if is_home[i] else rest_b2b_road
+            elif days_rest[i] == 2:
+                score += rest_optimal
+            elif days_rest[i] >= 3:
+                score += rest_rust
+            
+            if dvp_code[i] == DVP_WEAK:
+                score += dvp_weak
+            elif dvp_code[i] == DVP_STRONG:
+                score += dvp_strong
+            
+            if proj_minutes[i] >= 34:
+                score += minutes_high
+            elif proj_minutes[i] >= 30:
+                score += minutes_med
+            elif proj_minutes[i] < 26:
+                score += minutes_low
+            
+            if stdev[i] <= 5:
+                score += consistency_stable
+            elif stdev[i] > 7:
+                score += consistency_volatile
+            
+            adj_pct = max(-0.15, min(0.15, score / 40.0))
+            pred = baseline[i] * (1.0 + adj_pct)
+            if proj_minutes[i] < 26:
+                pred = min(pred, baseline[i])
+            
+            err = pred - actual[i]
+            sum_abs += abs(err)
+            sum_err += err
+            sum_sq += err * err
+            if abs(err) <= 5:
+                within_5 += 1
+        return sum_abs, sum_err, sum_sq, within_5
+
+    try:
+        # Ahead-of-time build from --build-kernels: no JIT at startup, but
+        # single-threaded (prange runs as a plain loop)
+        from sim_kernels import eval_kernel as _eval_kernel
+    except ImportError:
+        _eval_kernel = njit(parallel=True, cache=True)(_eval_kernel_impl)
+    
+    def _evaluate_numba(W: np.ndarray, soa: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Per-config (K,) metrics from one _eval_kernel call per weight row."""
+        n = len(soa["actual_pts"])
+        sums = np.zeros((len(W), 4))
+        if n:
+            columns = (
+                soa["season_pts_avg"], soa["l5_pts_avg"], soa["pace_env"], soa["usg_pct"],
+                soa["days_rest"], soa["is_home"], soa["dvp_code"], soa["proj_minutes"],
+                soa["l5_pts_stdev"], soa["baseline_proj"], soa["actual_pts"],
+            )
+            for j in range(len(W)):
+                sums[j] = _eval_kernel(W[j], *columns)
+            sums /= n
+        return {
+            "mae": sums[:, 0],
+            "rmse": np.sqrt(sums[:, 2]),
+            "bias": sums[:, 1],
+            "within_5_pts_pct": sums[:, 3] * 100,
+        }
+
+
+_KERNEL_READY = False
+
+
+def _ensure_compiled() -> None:
+    """Compile (or load from cache) the numba kernel before the sweep.
     
-    # Evaluate
-    result = evaluate_config(config, train_records, validation_records)
+    Called from main rather than at import so that importing the module,
+    --help and --build-kernels stay free of JIT work.
+    """
+    global _KERNEL_READY
+    if _KERNEL_READY or not HAS_NUMBA:
+        return
+    _eval_kernel(
+        np.ones(len(WEIGHT_NAMES)),
+        np.full(1, 20.0),
+        np.full(1, 20.0),
+        np.full(1, 100.0),
+        np.full(1, np.nan),
+        np.ones(1, dtype=np.int64),
+        np.ones(1, dtype=np.bool_),
+        np.zeros(1, dtype=np.int8),
+        np.full(1, 30.0),
+        np.full(1, 5.0),
+        np.full(1, 20.0),
+        np.full(1, 20.0),
+    )
+    _KERNEL_READY = True
+
+
+def build_kernels() -> None:
+    """
+    Ahead-of-time compile the evaluation kernel into a sim_kernels extension
+    module next to this script, so later runs skip numba's JIT entirely.
+    """
+    if not HAS_NUMBA:
+        raise RuntimeError("numba is required to build the simulation kernels")
     
-    # Return as dict for pickling
-    return {
-        "config": result.config.to_dict(),
-        "train_metrics": result.train_metrics,
-        "validation_metrics": result.validation_metrics,
-        "config_id": result.config_id,
-    }
+    from numba.pycc import CC
+    
+    cc = CC("sim_kernels")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export("eval_kernel", _EVAL_KERNEL_SIGNATURE)(_eval_kernel_impl)
+    cc.compile()
+    print(f"Built {os.path.join(cc.output_dir, cc.output_file)}", file=sys.stderr)
+
+
+# (name, shape, dtype) of each SoA column placed in shared memory
+ShmMeta = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+
+def _soa_to_shm(soa: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory], ShmMeta]:
+    """Copy each SoA column into its own SharedMemory block."""
+    blocks = []
+    meta = {}
+    for key, col in soa.items():
+        shm = shared_memory.SharedMemory(create=True, size=max(col.nbytes, 1))
+        blocks.append(shm)
+        np.ndarray(col.shape, dtype=col.dtype, buffer=shm.buf)[...] = col
+        meta[key] = (shm.name, col.shape, col.dtype.str)
+    return blocks, meta
+
+
+def _soa_from_shm(meta: ShmMeta) -> Tuple[List[shared_memory.SharedMemory], Dict[str, np.ndarray]]:
+    """Attach to SharedMemory blocks and view them as SoA columns (no copy)."""
+    blocks = []
+    soa = {}
+    for key, (name, shape, dtype) in meta.items():
+        shm = shared_memory.SharedMemory(name=name)
+        blocks.append(shm)
+        soa[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return blocks, soa
+
+
+# Train/validation SoA views held by each worker process (set by _init_worker).
+# The SharedMemory handles are kept alongside so the buffers stay mapped.
+_WORKER_SOA: Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]] = ({}, {})
+_WORKER_SHM: List[shared_memory.SharedMemory] = []
+
+
+def _init_worker(train_meta: ShmMeta, validation_meta: ShmMeta) -> None:
+    """Pool initializer: attach to the shared SoA once so tasks only carry weights."""
+    global _WORKER_SOA
+    train_blocks, train_soa = _soa_from_shm(train_meta)
+    validation_blocks, validation_soa = _soa_from_shm(validation_meta)
+    _WORKER_SHM.extend(train_blocks + validation_blocks)
+    _WORKER_SOA = (train_soa, validation_soa)
+
+
+def _evaluate_config_worker(W: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """Worker function for parallel evaluation of a chunk of weight rows."""
+    return evaluate_weight_matrix(W, *_WORKER_SOA)
 
 
 def evaluate_config(
     config: WeightConfig,
-    train_records: List[PlayerGameRecord],
-    validation_records: List[PlayerGameRecord],
+    train_soa: Dict[str, np.ndarray],
+    validation_soa: Dict[str, np.ndarray],
 ) -> SimulationResult:
     """Evaluate a weight configuration on train and validation sets."""
-    # Train predictions
-    train_preds = compute_predictions_with_weights(train_records, config)
-    train_errors = [pred - actual for pred, actual in train_preds]
-    train_abs_errors = [abs(e) for e in train_errors]
-    
-    train_mae = sum(train_abs_errors) / len(train_abs_errors) if train_abs_errors else 0.0
-    train_bias = sum(train_errors) / len(train_errors) if train_errors else 0.0
-    train_within_5 = sum(1 for e in train_abs_errors if e <= 5) / len(train_abs_errors) * 100 if train_abs_errors else 0.0
-    
-    # Validation predictions
-    val_preds = compute_predictions_with_weights(validation_records, config)
-    val_errors = [pred - actual for pred, actual in val_preds]
-    val_abs_errors = [abs(e) for e in val_errors]
-    
-    val_mae = sum(val_abs_errors) / len(val_abs_errors) if val_abs_errors else 0.0
-    val_bias = sum(val_errors) / len(val_errors) if val_errors else 0.0
-    val_within_5 = sum(1 for e in val_abs_errors if e <= 5) / len(val_abs_errors) * 100 if val_abs_errors else 0.0
-    
-    # RMSE
-    train_rmse = (sum(e ** 2 for e in train_errors) / len(train_errors)) ** 0.5 if train_errors else 0.0
-    val_rmse = (sum(e ** 2 for e in val_errors) / len(val_errors)) ** 0.5 if val_errors else 0.0
-    
+    train_metrics, validation_metrics = evaluate_weight_matrix(
+        weights_to_array(config)[None, :], train_soa, validation_soa
+    )
     return SimulationResult(
         config=config,
-        train_metrics={
-            "mae": round(train_mae, 3),
-            "rmse": round(train_rmse, 3),
-            "bias": round(train_bias, 3),
-            "within_5_pts_pct": round(train_within_5, 2),
-            "n_players": len(train_records),
-        },
-        validation_metrics={
-            "mae": round(val_mae, 3),
-            "rmse": round(val_rmse, 3),
-            "bias": round(val_bias, 3),
-            "within_5_pts_pct": round(val_within_5, 2),
-            "n_players": len(validation_records),
-        },
+        train_metrics=_make_metrics_dict(train_metrics, 0, len(train_soa["actual_pts"])),
+        validation_metrics=_make_metrics_dict(validation_metrics, 0, len(validation_soa["actual_pts"])),
         config_id="",
     )
 
@@ -309,82 +638,46 @@ def generate_monte_carlo_configs(
     base_config: WeightConfig,
     n_samples: int,
     optimize_factors: Optional[List[str]] = None,
-) -> List[WeightConfig]:
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
     Generate random weight configurations using Monte Carlo sampling.
     If optimize_factors is specified, only vary those factors.
+    Returns an (n_samples, F) weight matrix in WEIGHT_NAMES order.
     """
-    configs = []
-    
-    # Define search spaces for each factor
-    search_spaces = {
-        "form_multiplier": [4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5],
-        "form_cap": [2.0, 2.2, 2.4, 2.6, 2.8],
-        "pace_fast": [1.2, 1.5, 1.8, 2.0, 2.2, 2.5],
-        "pace_slow": [-1.2, -1.5, -1.8, -2.0, -2.2, -2.5],
-        "usage_high": [0.8, 1.0, 1.2, 1.4, 1.6],
-        "usage_low": [-0.6, -0.8, -1.0, -1.2],
-        "rest_b2b_road": [-1.5, -2.0, -2.5, -3.0],
-        "rest_b2b_home": [-1.0, -1.2, -1.5, -1.8],
-        "rest_optimal": [0.2, 0.3, 0.4, 0.5, 0.6],
-        "rest_rust": [-0.2, -0.3, -0.4, -0.5],
-        "dvp_weak": [1.5, 2.0, 2.5],
-        "dvp_strong": [-1.5, -2.0, -2.5],
-        "minutes_high": [1.5, 2.0, 2.5],
-        "minutes_med": [0.8, 1.0, 1.2],
-        "minutes_low": [-2.5, -3.0, -3.5],
-        "consistency_stable": [1.2, 1.5, 1.8],
-        "consistency_volatile": [-1.2, -1.5, -1.8],
-    }
+    rng = rng or np.random.default_rng()
+    factors_to_sample = set(optimize_factors) if optimize_factors else SEARCH_SPACES.keys()
     
-    if HAS_NUMPY:
-        rng = np.random.default_rng()
+    W = np.tile(weights_to_array(base_config), (n_samples, 1))
+    for j, factor in enumerate(WEIGHT_NAMES):
+        if factor in factors_to_sample and factor in SEARCH_SPACES:
+            W[:, j] = rng.choice(SEARCH_SPACES[factor], size=n_samples)
     
-    for i in range(n_samples):
-        config_dict = base_config.to_dict()
-        
-        # Sample factors to optimize
-        factors_to_sample = optimize_factors if optimize_factors else list(search_spaces.keys())
-        
-        for factor in factors_to_sample:
-            if factor in search_spaces:
-                if HAS_NUMPY:
-                    config_dict[factor] = float(rng.choice(search_spaces[factor]))
-                else:
-                    config_dict[factor] = float(random.choice(search_spaces[factor]))
-        
-        configs.append(WeightConfig.from_dict(config_dict))
-    
-    return configs
+    return W
 
 
 def generate_grid_configs(
     base_config: WeightConfig,
     optimize_factors: List[str],
-    grid_steps: Dict[str, List[float]],
-) -> List[WeightConfig]:
+    grid_steps: Dict[str, Sequence[float]],
+) -> np.ndarray:
     """
     Generate grid search configurations around promising regions.
+    Every combination of grid_steps values for optimize_factors (in
+    itertools.product order); other factors stay at base_config.
+    Returns a (K, F) weight matrix in WEIGHT_NAMES order.
     """
-    configs = []
-    
-    # Start with base config
-    config_dict = base_config.to_dict()
-    
-    # Generate all combinations for specified factors
-    import itertools
-    
-    factor_values = {factor: grid_steps.get(factor, [config_dict[factor]]) for factor in optimize_factors}
-    factor_names = list(factor_values.keys())
-    value_lists = [factor_values[name] for name in factor_names]
+    value_lists = [
+        np.asarray(grid_steps.get(factor, [getattr(base_config, factor)]), dtype=np.float64)
+        for factor in optimize_factors
+    ]
+    mesh = np.meshgrid(*value_lists, indexing="ij")
     
-    for combo in itertools.product(*value_lists):
-        new_config_dict = config_dict.copy()
-        for name, value in zip(factor_names, combo):
-            new_config_dict[name] = value
-        configs.append(WeightConfig.from_dict(new_config_dict))
+    W = np.tile(weights_to_array(base_config), (mesh[0].size, 1))
+    for factor, values in zip(optimize_factors, mesh):
+        W[:, WEIGHT_NAMES.index(factor)] = values.ravel()
     
-    return configs
+    return W
 
 
 def run_simulation(
@@ -394,6 +687,9 @@ def run_simulation(
     optimize_factors: Optional[List[str]] = None,
     fix_all_others: bool = False,
     max_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    halving: bool = False,
+    grid: bool = False,
 ) -> Dict[str, Any]:
     """
     Run weight optimization simulation.
@@ -404,26 +700,39 @@ def run_simulation(
         monte_carlo_samples: Number of Monte Carlo samples
         optimize_factors: List of factors to optimize (None = all)
         fix_all_others: If True, only optimize specified factors, keep others at current values
+        seed: Seed for the train/validation split, Monte Carlo sampling and
+            halving subsamples (None = nondeterministic)
+        halving: If True, prune configs by successive halving on the train set
+            before the full evaluation
+        grid: If True, also evaluate the full SEARCH_SPACES grid over
+            optimize_factors (required); best combined with halving
     """
     print(f"=" * 70, file=sys.stderr)
     print(f"WEIGHT OPTIMIZATION SIMULATION", file=sys.stderr)
     print(f"=" * 70, file=sys.stderr)
     print(f"Total records: {len(records)}", file=sys.stderr)
     
-    # Split into train/validation
-    random.shuffle(records)
-    split_idx = int(len(records) * train_ratio)
-    train_records = records[:split_idx]
-    validation_records = records[split_idx:]
+    # Convert to struct-of-arrays once; workers only ever see the arrays
+    soa = records_to_soa(records)
     
-    print(f"Train records: {len(train_records)} ({train_ratio*100:.1f}%)", file=sys.stderr)
-    print(f"Validation records: {len(validation_records)} ({(1-train_ratio)*100:.1f}%)", file=sys.stderr)
+    # Split into train/validation by a random permutation of row indices
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(len(records))
+    split_idx = int(len(records) * train_ratio)
+    # Fancy indexing materializes fresh contiguous columns per split, so the
+    # evaluators stream sequentially; the unsplit arrays are no longer needed
+    train_soa = {key: col[perm[:split_idx]] for key, col in soa.items()}
+    validation_soa = {key: col[perm[split_idx:]] for key, col in soa.items()}
+    del soa
+    
+    print(f"Train records: {split_idx} ({train_ratio*100:.1f}%)", file=sys.stderr)
+    print(f"Validation records: {len(records) - split_idx} ({(1-train_ratio)*100:.1f}%)", file=sys.stderr)
     print(f"-" * 70, file=sys.stderr)
     
     # Get current weights baseline
     current_config = WeightConfig.current_weights()
     print(f"\nEvaluating CURRENT weights...", file=sys.stderr)
-    current_result = evaluate_config(current_config, train_records, validation_records)
+    current_result = evaluate_config(current_config, train_soa, validation_soa)
     
     print(f"Current Train MAE: {current_result.train_metrics['mae']:.3f} | "
           f"Validation MAE: {current_result.validation_metrics['mae']:.3f}", file=sys.stderr)
@@ -439,86 +748,158 @@ def run_simulation(
     else:
         base_config = current_config
     
-    monte_carlo_configs = generate_monte_carlo_configs(
+    W = generate_monte_carlo_configs(
         base_config,
         monte_carlo_samples,
         optimize_factors=optimize_factors,
+        rng=rng,
     )
+    n_monte_carlo = len(W)
+    
+    if grid:
+        if not optimize_factors:
+            raise ValueError("grid search requires optimize_factors")
+        W_grid = generate_grid_configs(base_config, optimize_factors, SEARCH_SPACES)
+        print(f"Adding {len(W_grid)} grid configurations...", file=sys.stderr)
+        W = np.vstack((W, W_grid))
+    
+    # Row 0 is the current config, so its rank can be read off by index;
+    # Monte Carlo rows follow, then any grid rows
+    W = np.vstack((weights_to_array(current_config), W))
+    n_configs = len(W)
+    
+    # Evaluate each distinct config once; config_to_row maps every sampled
+    # config to its row of W (-1 once pruned by halving)
+    W, config_to_row = np.unique(W, axis=0, return_inverse=True)
+    config_to_row = config_to_row.reshape(-1)
+    print(f"Deduplicated {n_configs} → {len(W)} configurations", file=sys.stderr)
+    
+    if halving:
+        # Keep the current config in the final evaluation regardless
+        kept = np.union1d([config_to_row[0]], run_halving(W, train_soa, rng=rng))
+        print(f"Successive halving kept {len(kept)} of {len(W)} configurations", file=sys.stderr)
+        new_row = np.full(len(W), -1)
+        new_row[kept] = np.arange(len(kept))
+        config_to_row = new_row[config_to_row]
+        W = W[kept]
     
     # Evaluate all configurations (with parallel processing)
-    print(f"Evaluating {monte_carlo_samples} configurations...", file=sys.stderr)
+    print(f"Evaluating {len(W)} configurations (including current)...", file=sys.stderr)
     
     # Determine number of workers
     if max_workers is None:
         max_workers = max(1, multiprocessing.cpu_count() - 1)  # Leave one core free
     
-    print(f"Using {max_workers} parallel workers", file=sys.stderr)
-    
-    # Convert records to dicts for pickling
-    train_records_dicts = [asdict(r) for r in train_records]
-    validation_records_dicts = [asdict(r) for r in validation_records]
-    
-    # Prepare tasks
-    tasks = [
-        (config.to_dict(), train_records_dicts, validation_records_dicts)
-        for config in monte_carlo_configs
-    ]
-    
-    results = []
+    # The numba kernel runs its own threads, so it stays in-process
+    if HAS_NUMBA:
+        max_workers = 1
+        print(f"Using numba kernel (in-process, multi-threaded)", file=sys.stderr)
+    else:
+        print(f"Using {max_workers} parallel workers", file=sys.stderr)
+    
+    # Split the weight matrix into batches; each task is evaluated in one
+    # vectorized call
+    n_chunks = min(len(W), max_workers * 4) if max_workers > 1 else 1
+    chunk_bounds = np.linspace(0, len(W), n_chunks + 1).astype(int)
+    n_train = len(train_soa["actual_pts"])
+    n_validation = len(validation_soa["actual_pts"])
+    
+    # Raw (K,) metric arrays; NaN marks configs whose chunk failed
+    metric_names = ("mae", "rmse", "bias", "within_5_pts_pct")
+    train_metrics = {name: np.full(len(W), np.nan) for name in metric_names}
+    validation_metrics = {name: np.full(len(W), np.nan) for name in metric_names}
     completed = 0
     
-    # Use ProcessPoolExecutor for parallel evaluation
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_config = {
-            executor.submit(_evaluate_config_worker, task): i
-            for i, task in enumerate(tasks)
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_config):
-            config_idx = future_to_config[future]
-            try:
-                result_dict = future.result()
-                # Reconstruct SimulationResult
-                result = SimulationResult(
-                    config=WeightConfig.from_dict(result_dict["config"]),
-                    train_metrics=result_dict["train_metrics"],
-                    validation_metrics=result_dict["validation_metrics"],
-                    config_id=f"mc_{config_idx+1}",
-                )
-                results.append(result)
-                completed += 1
+    def _collect(lo: int, chunk_train: Dict[str, np.ndarray], chunk_validation: Dict[str, np.ndarray]) -> None:
+        nonlocal completed
+        hi = lo + len(chunk_train["mae"])
+        for name in metric_names:
+            train_metrics[name][lo:hi] = chunk_train[name]
+            validation_metrics[name][lo:hi] = chunk_validation[name]
+        completed += hi - lo
+        print(f"  Progress: {completed}/{len(W)} ({completed*100//len(W)}%)", file=sys.stderr)
+    
+    if n_chunks == 1:
+        _collect(0, *evaluate_weight_matrix(W, train_soa, validation_soa))
+    else:
+        # Use ProcessPoolExecutor for parallel evaluation.
+        # Records live in shared memory that each worker attaches to once in
+        # the initializer; tasks only carry their slice of the weight matrix.
+        train_blocks, train_meta = _soa_to_shm(train_soa)
+        validation_blocks, validation_meta = _soa_to_shm(validation_soa)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(train_meta, validation_meta),
+            ) as executor:
+                tasks = [W[lo:hi] for lo, hi in zip(chunk_bounds[:-1], chunk_bounds[1:])]
+                chunksize = max(1, len(tasks) // (max_workers * 4))
                 
-                # Progress update
-                if completed % max(1, monte_carlo_samples // 20) == 0 or completed == monte_carlo_samples:
-                    print(f"  Progress: {completed}/{monte_carlo_samples} ({completed*100//monte_carlo_samples}%)", file=sys.stderr)
-            except Exception as e:
-                print(f"  [ERROR] Config {config_idx+1} failed: {e}", file=sys.stderr)
-    
-    print(f"Completed evaluation of {len(results)} configurations", file=sys.stderr)
+                # map preserves task order, so chunk_bounds tells where each
+                # result belongs; a failure leaves the remaining rows as NaN
+                try:
+                    for lo, chunk_metrics in zip(
+                        chunk_bounds,
+                        executor.map(_evaluate_config_worker, tasks, chunksize=chunksize),
+                    ):
+                        _collect(lo, *chunk_metrics)
+                except Exception as e:
+                    print(f"  [ERROR] Configs {completed+1}-{len(W)} failed: {e}", file=sys.stderr)
+        finally:
+            for shm in train_blocks + validation_blocks:
+                shm.close()
+                shm.unlink()
+    
+    # Rank distinct configs only. Each row of W is labelled by the first
+    # sampled config that produced it, which also breaks exact ties in
+    # sampling order as before
+    sampled = np.flatnonzero(config_to_row >= 0)
+    _, first = np.unique(config_to_row[sampled], return_index=True)
+    first_sample = sampled[first]
+    
+    evaluated = np.flatnonzero(~np.isnan(validation_metrics["mae"]))
+    print(f"Completed evaluation of {len(evaluated)} configurations", file=sys.stderr)
     
     # Sort by validation MAE (primary) and bias (secondary)
-    results.sort(key=lambda r: (r.validation_metrics['mae'], abs(r.validation_metrics['bias'])))
-    
-    # Rank results
-    for i, result in enumerate(results):
-        result.rank = i + 1
-    
-    # Find current config rank
-    current_rank = len(results) + 1
-    for i, result in enumerate(results):
-        if (result.config.form_multiplier == current_config.form_multiplier and
-            result.config.pace_fast == current_config.pace_fast and
-            result.config.usage_high == current_config.usage_high):
-            current_rank = result.rank
-            break
-    
-    # Get top 10 configurations
-    top_configs = results[:10]
+    order = evaluated[np.lexsort((
+        first_sample[evaluated],
+        np.abs(validation_metrics["bias"][evaluated]),
+        validation_metrics["mae"][evaluated],
+    ))]
+    
+    # Rank results; the current config is sample 0
+    ranks = np.zeros(len(W), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+    current_row = config_to_row[0]
+    current_rank = int(ranks[current_row]) if ranks[current_row] else len(order) + 1
+    
+    # Only the top 10 are materialized for reporting. Each weights dict is
+    # built once and shared by the summary, best_config and top_10_configs.
+    top_rows = order[:10]
+    top_weights = [weights_from_array(W[i]) for i in top_rows]
+    
+    def _config_id(i: int) -> str:
+        if i == 0:
+            return "current"
+        if i <= n_monte_carlo:
+            return f"mc_{i}"
+        return f"grid_{i - n_monte_carlo - 1}"
+    
+    top_configs = [
+        SimulationResult(
+            config=WeightConfig(**weights),
+            train_metrics=_make_metrics_dict(train_metrics, i, n_train),
+            validation_metrics=_make_metrics_dict(validation_metrics, i, n_validation),
+            config_id=_config_id(first_sample[i]),
+            rank=rank,
+        )
+        for rank, (i, weights) in enumerate(zip(top_rows, top_weights), 1)
+    ]
+    current_weights = current_config.to_dict()
     
     # Check if improvements meet thresholds
-    best_result = results[0]
+    best_result = top_configs[0]
     improvement_mae = current_result.validation_metrics['mae'] - best_result.validation_metrics['mae']
     improvement_bias = abs(current_result.validation_metrics['bias']) - abs(best_result.validation_metrics['bias'])
     improvement_within_5 = best_result.validation_metrics['within_5_pts_pct'] - current_result.validation_metrics['within_5_pts_pct']
@@ -533,7 +914,7 @@ def run_simulation(
     print(f"\n" + "=" * 70, file=sys.stderr)
     print(f"RESULTS SUMMARY", file=sys.stderr)
     print(f"=" * 70, file=sys.stderr)
-    print(f"\nCurrent Config Rank: #{current_rank} out of {len(results)}", file=sys.stderr)
+    print(f"\nCurrent Config Rank: #{current_rank} out of {len(order)}", file=sys.stderr)
     print(f"\nBEST CONFIGURATION:", file=sys.stderr)
     print(f"  Validation MAE: {best_result.validation_metrics['mae']:.3f} "
           f"(improvement: {improvement_mae:+.3f})", file=sys.stderr)
@@ -543,8 +924,7 @@ def run_simulation(
           f"(improvement: {improvement_within_5:+.1f}%)", file=sys.stderr)
     
     print(f"\nKey Weight Changes:", file=sys.stderr)
-    best_weights = best_result.config.to_dict()
-    current_weights = current_config.to_dict()
+    best_weights = top_weights[0]
     for key in ["form_multiplier", "pace_fast", "pace_slow", "usage_high", "usage_low",
                 "rest_b2b_road", "rest_b2b_home", "rest_optimal"]:
         if best_weights[key] != current_weights[key]:
@@ -562,7 +942,8 @@ def run_simulation(
     
     return {
         "simulation_summary": {
-            "total_configs_tested": len(results),
+            "total_configs_tested": len(order),
+            "sampled_configs": n_configs,
             "current_config_rank": current_rank,
             "meets_thresholds": meets_thresholds,
             "improvement_mae": round(improvement_mae, 3),
@@ -570,12 +951,12 @@ def run_simulation(
             "improvement_within_5_pct": round(improvement_within_5, 2),
         },
         "current_config": {
-            "weights": current_config.to_dict(),
+            "weights": current_weights,
             "train_metrics": current_result.train_metrics,
             "validation_metrics": current_result.validation_metrics,
         },
         "best_config": {
-            "weights": best_result.config.to_dict(),
+            "weights": best_weights,
             "train_metrics": best_result.train_metrics,
             "validation_metrics": best_result.validation_metrics,
             "config_id": best_result.config_id,
@@ -584,10 +965,10 @@ def run_simulation(
         "top_10_configs": [
             {
                 "rank": r.rank,
-                "weights": r.config.to_dict(),
+                "weights": weights,
                 "validation_metrics": r.validation_metrics,
             }
-            for r in top_configs
+            for r, weights in zip(top_configs, top_weights)
         ],
     }
 
@@ -598,18 +979,15 @@ def main() -> None:
     )
     parser.add_argument(
         "--start-date",
-        required=True,
         help="Start date for historical data (YYYY-MM-DD)",
     )
     parser.add_argument(
         "--end-date",
-        required=True,
         help="End date for historical data (YYYY-MM-DD)",
     )
     parser.add_argument(
         "--season",
         type=int,
-        required=True,
         help="Season year (e.g., 2025 for 2024-25 season)",
     )
     parser.add_argument(
@@ -645,13 +1023,46 @@ def main() -> None:
         default=None,
         help="Number of parallel workers (default: auto-detect, CPU count - 1)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for the train/validation split and sampling (default: random)",
+    )
+    parser.add_argument(
+        "--halving",
+        action="store_true",
+        help="Prune configs by successive halving on train subsamples before full evaluation",
+    )
+    parser.add_argument(
+        "--grid",
+        action="store_true",
+        help="Also evaluate every SEARCH_SPACES combination of the --optimize factors "
+             "(grows multiplicatively; best combined with --halving)",
+    )
     parser.add_argument(
         "--no-parallel",
         action="store_true",
         help="Disable parallel processing (use single thread)",
     )
+    parser.add_argument(
+        "--build-kernels",
+        action="store_true",
+        help="AOT-compile the numba evaluation kernel (sim_kernels) and exit",
+    )
     args = parser.parse_args()
     
+    if args.build_kernels:
+        build_kernels()
+        return
+    if not args.start_date or not args.end_date or args.season is None:
+        parser.error("--start-date, --end-date and --season are required")
+    if args.grid and not args.optimize:
+        parser.error("--grid requires --optimize")
+    
+    # Compile up front so the sweep doesn't pay for it.
+    _ensure_compiled()
+    
     # Parse dates
     try:
         start_date = date.fromisoformat(args.start_date)
@@ -669,16 +1080,22 @@ def main() -> None:
     teams_map = get_teams_map()
     all_records: List[PlayerGameRecord] = []
     
-    current_date = start_date
-    while current_date <= end_date:
-        games = get_games_on_date(current_date)
-        for game in games:
+    def _fetch_day(day: date) -> List[PlayerGameRecord]:
+        """Fetch and process every game on one day (runs in a fetch thread)."""
+        day_records: List[PlayerGameRecord] = []
+        for game in get_games_on_date(day):
             try:
-                records = process_game(game, args.season, teams_map)
-                all_records.extend(records)
+                day_records.extend(process_game(game, args.season, teams_map))
             except Exception as e:
-                print(f"  [WARN] Failed to process game on {current_date}: {e}", file=sys.stderr)
-        current_date += timedelta(days=1)
+                print(f"  [WARN] Failed to process game on {day}: {e}", file=sys.stderr)
+        return day_records
+    
+    # Days are fetched concurrently; map keeps date order so a seeded split
+    # sees the same record order on every run
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        for day_records in pool.map(_fetch_day, days):
+            all_records.extend(day_records)
     
     if len(all_records) < 100:
         print(f"Error: Insufficient data ({len(all_records)} records). Need at least 100.", file=sys.stderr)
@@ -700,6 +1117,9 @@ def main() -> None:
         optimize_factors=args.optimize,
         fix_all_others=args.fix_all_others,
         max_workers=max_workers,
+        seed=args.seed,
+        halving=args.halving,
+        grid=args.grid,
     )
     
     # Add metadata
@@ -710,19 +1130,27 @@ def main() -> None:
         "total_records": len(all_records),
         "train_ratio": args.train_ratio,
         "monte_carlo_samples": args.monte_carlo_samples,
+        "seed": args.seed,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
     
+    # Serialize once; reused for the file and stdout
+    if HAS_ORJSON:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(results, indent=2).encode()
+    
     # Save results
-    with open(args.output, "w") as f:
-        json.dump(results, f, indent=2)
+    with open(args.output, "wb") as f:
+        f.write(data)
     
     print(f"\nResults saved to {args.output}", file=sys.stderr)
     
     # Print JSON to stdout
     print("\n" + "=" * 70, file=sys.stderr)
     print("JSON OUTPUT:", file=sys.stderr)
-    print(json.dumps(results, indent=2))
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.write(b"\n")
 
 
 if __name__ == "__main__":
@@ -49,6 +49,7 @@ import json
 import os
 import statistics
 import sys
+import threading
 import time
 from collections import deque
 
@@ -74,9 +75,27 @@ BALDONTLIE_BASE_V2 = "https://api.balldontlie.io/v2"
 _REQUEST_WINDOW_SEC = 60
 _MAX_REQUESTS_PER_WINDOW = 50  # keep below 60/min to be safe
 _REQUEST_TIMES: deque = deque()
+_REQUEST_LOCK = threading.Lock()
 _HTTP_TIMEOUT_SEC = 45
 
 
+def _wait_for_request_slot() -> None:
+    """Block until the rate limiter has room, then record the request.
+
+    Held under a lock so concurrent callers (e.g. threaded date fetches)
+    cannot all pass the check at once and burst past the cap.
+    """
+    with _REQUEST_LOCK:
+        now = time.time()
+        while _REQUEST_TIMES and now - _REQUEST_TIMES[0] > _REQUEST_WINDOW_SEC:
+            _REQUEST_TIMES.popleft()
+        if len(_REQUEST_TIMES) >= _MAX_REQUESTS_PER_WINDOW:
+            sleep_for = _REQUEST_WINDOW_SEC - (now - _REQUEST_TIMES[0]) + 0.1
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+        _REQUEST_TIMES.append(time.time())
+
+
 def bdl_get(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Thin wrapper over BallDontLie HTTP GET."""
 
@@ -97,16 +116,9 @@ def bdl_get(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
     url = base + rel
     headers = {"Authorization": api_key}
 
-    now = time.time()
-    while _REQUEST_TIMES and now - _REQUEST_TIMES[0] > _REQUEST_WINDOW_SEC:
-        _REQUEST_TIMES.popleft()
-    if len(_REQUEST_TIMES) >= _MAX_REQUESTS_PER_WINDOW:
-        sleep_for = _REQUEST_WINDOW_SEC - (now - _REQUEST_TIMES[0]) + 0.1
-        if sleep_for > 0:
-            time.sleep(sleep_for)
-
     resp: Optional[requests.Response] = None
     for attempt in range(3):
+        _wait_for_request_slot()
         try:
             resp = requests.get(url, headers=headers, params=params, timeout=_HTTP_TIMEOUT_SEC)
         except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError):
@@ -115,7 +127,6 @@ def bdl_get(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
                 continue
             raise
 
-        _REQUEST_TIMES.append(time.time())
         if resp.status_code == 429 and attempt < 2:
             time.sleep(1.0 + attempt * 1.5)
             continue
@@ -19,19 +19,44 @@ Usage:
     --home MIN \
     --season 2025
 
+  # Score a whole slate in one batch (JSON list of
+  # {"game_date", "away", "home"[, "season", "away_starters", "home_starters"]}):
+  python points_picks.py --slate slate.json --season 2025
+
 Notes:
 - Uses automated DvP from GAME_DATA (no manual web research needed)
 - Injury statuses are respected: OUT/DOUBTFUL are excluded
 - Scheme/FT environment adjustments remain optional (prompt workflow)
+- numba (optional) JIT-compiles the per-player scoring core
+- orjson (optional) speeds up the final JSON dump
 """
 
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import math
+import operator
+import sys
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 try:
@@ -46,6 +71,9 @@ except Exception as e:  # pragma: no cover
 
 INACTIVE_STATUSES = {"OUT", "DOUBTFUL"}
 
+# Shared stand-in for missing nested stat dicts; never mutated.
+_EMPTY: Dict[str, Any] = {}
+
 
 def _normalize_status(status: Optional[str]) -> str:
     if not status:
@@ -58,6 +86,13 @@ def _normalize_status(status: Optional[str]) -> str:
 
 
 def _safe_float(x: Any, default: float = 0.0) -> float:
+    # JSON numbers are almost always float/int already; skip the try/except.
+    if type(x) is float:
+        return x
+    if type(x) is int:
+        return float(x)
+    if x is None:
+        return default
     try:
         return float(x)
     except Exception:
@@ -71,6 +106,7 @@ def _cap(value: float, low: float, high: float) -> float:
 _NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
 
 
+@lru_cache(maxsize=4096)
 def _normalize_name_for_match(name: str) -> str:
     """Normalize player names for fuzzy matching."""
 
@@ -89,7 +125,7 @@ def _parse_csv_names(value: Optional[str]) -> List[str]:
     return [p.strip() for p in value.split(",") if p.strip()]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Candidate:
     player: str
     team: str
@@ -108,38 +144,29 @@ class Candidate:
     why_summary: str
 
 
-def _project_minutes(player: Dict[str, Any]) -> Tuple[float, float]:
-    """Return (proj_minutes, recent_minutes_avg)."""
-
-    recent = player.get("recent") or {}
-    season = player.get("season") or {}
-
-    recent_minutes_avg = _safe_float(recent.get("minutes_avg"), 0.0)
-    season_minutes = _safe_float(season.get("minutes"), 0.0)
-
-    # If we have a meaningful recent sample, trust it; otherwise fall back.
-    sample_size = int(recent.get("sample_size") or 0)
-    if sample_size >= 3 and recent_minutes_avg > 0:
-        proj_minutes = recent_minutes_avg
-    else:
-        proj_minutes = season_minutes or recent_minutes_avg
+def _pace_env_factor(projected_game_pace: Optional[float]) -> float:
+    """Pace factor calibrated for 2024-25 (league avg ~101.9).
 
-    return round(proj_minutes, 2), round(recent_minutes_avg, 2)
-
-
-def _compute_environment_adj(projected_game_pace: Optional[float], proj_minutes: float) -> float:
-    """Pace adjustment calibrated for 2024-25 (league avg ~101.9)."""
+    Evaluated once per game; 0.0 when pace is unknown or neutral.
+    """
     if projected_game_pace is None:
         return 0.0
 
     # Updated thresholds for 2024-25 high-pace era
     if projected_game_pace > 104:
-        return 1.5 * (proj_minutes / 35.0)
+        return 1.5
     if projected_game_pace < 99:
-        return -1.5 * (proj_minutes / 35.0)
+        return -1.5
     return 0.0
 
 
+def _compute_environment_adj(pace_factor: float, proj_minutes: float) -> float:
+    """Pace adjustment, scaled by the player's share of 35 minutes."""
+    if not pace_factor:
+        return 0.0
+    return pace_factor * (proj_minutes / 35.0)
+
+
 def _compute_usage_adj(usg_pct: Optional[float]) -> float:
     """Usage rate adjustment - higher usage = more scoring opportunities."""
     if usg_pct is None:
@@ -189,12 +216,18 @@ def _compute_form_adj(l5_pts_avg: float, season_pts: float) -> float:
     return _cap(raw, -3.0, 3.0)
 
 
+# Step-function tables. Stdev bands are upper-inclusive (<= 5, <= 7), so they
+# use bisect_left; the minutes bands are lower-inclusive (< 26, >= 30) and use
+# bisect_right.
+_STDEV_BINS = (5.0, 7.0)
+_STDEV_ADJ = (2.0, 0.0, -2.0)
+_STDEV_CONF = (6, 0, -6)
+_MINUTES_BINS = (26.0, 30.0)
+_MINUTES_CONF = (-12, 0, 10)
+
+
 def _compute_consistency_adj(l5_pts_stdev: float) -> float:
-    if l5_pts_stdev <= 5:
-        return 2.0
-    if l5_pts_stdev <= 7:
-        return 0.0
-    return -2.0
+    return _STDEV_ADJ[bisect_left(_STDEV_BINS, l5_pts_stdev)]
 
 
 def _fatigue_penalty(is_away: bool, is_b2b: bool, high_travel: bool) -> float:
@@ -245,16 +278,10 @@ def _confidence(
     base = 65
 
     # Minutes stability
-    if proj_minutes >= 30:
-        base += 10
-    elif proj_minutes < 26:
-        base -= 12
+    base += _MINUTES_CONF[bisect_right(_MINUTES_BINS, proj_minutes)]
 
     # Volatility
-    if l5_pts_stdev <= 5:
-        base += 6
-    elif l5_pts_stdev > 7:
-        base -= 6
+    base += _STDEV_CONF[bisect_left(_STDEV_BINS, l5_pts_stdev)]
 
     # Overall score
     if points_outcome_score >= 4:
@@ -286,10 +313,341 @@ def _confidence(
     return int(_cap(base, 50, 95))
 
 
-def _get_dvp_bucket(teams: Dict[str, Any], opp_abbr: str, position: str) -> str:
-    """Get DvP bucket for a player's position against opponent."""
-    opp_team = teams.get(opp_abbr) or {}
-    dvp = opp_team.get("dvp") or {}
+_DVP_CODES = {"WEAK": 1, "STRONG": 2}
+
+
+def _score_player_kernel(
+    season_pts: float,
+    l5_pts_avg: float,
+    l5_pts_stdev: float,
+    proj_minutes: float,
+    recent_minutes_avg: float,
+    pace_factor: float,
+    usg_pct: float,
+    days_rest: int,
+    dvp_code: int,
+    is_away: bool,
+    high_travel: bool,
+) -> Tuple[float, float, int]:
+    """Scalar scoring core: (points_outcome_score, unrounded proj_pts, confidence).
+
+    Mirrors the _compute_*_adj helpers, _project_points and _confidence with
+    everything inlined so it compiles in nopython mode. Pace comes in as the
+    per-game `_pace_env_factor`, missing usage as NaN and the DvP bucket as a
+    code (0=AVERAGE, 1=WEAK, 2=STRONG).
+    """
+    score = 0.0
+
+    # Environment (pace)
+    if pace_factor != 0.0:
+        score += pace_factor * (proj_minutes / 35.0)
+
+    # Minutes role
+    if recent_minutes_avg > 0:
+        diff = proj_minutes - recent_minutes_avg
+        score += diff * (0.30 if abs(diff) > 5 else 0.15)
+
+    # Form
+    if season_pts > 0:
+        raw = ((l5_pts_avg - season_pts) / season_pts) * 5.0
+        score += max(-3.0, min(3.0, raw))
+
+    # Consistency
+    if l5_pts_stdev <= 5:
+        score += 2.0
+    elif l5_pts_stdev > 7:
+        score += -2.0
+
+    # Usage
+    has_usg = not math.isnan(usg_pct)
+    if has_usg:
+        if usg_pct >= 28.0:
+            score += 1.5
+        elif usg_pct < 20.0:
+            score += -1.0
+
+    # Rest
+    if days_rest == 0:
+        score += -2.5 if is_away else -1.5
+    elif days_rest == 2:
+        score += 0.5
+    elif days_rest != 1:
+        score += -0.3
+
+    # DvP
+    if dvp_code == 1:
+        score += 2.0
+    elif dvp_code == 2:
+        score += -2.0
+
+    # Fatigue (travel only)
+    if high_travel:
+        score += -0.5
+
+    # Projection
+    baseline = 0.55 * season_pts + 0.45 * l5_pts_avg
+    minute_scale = 1.0
+    if recent_minutes_avg > 0:
+        minute_scale = max(0.85, min(1.15, proj_minutes / recent_minutes_avg))
+    context_bump = max(-0.20, min(0.20, score / 10.0))
+    proj_pts = baseline * minute_scale * (1.0 + context_bump)
+    if l5_pts_avg > 0 and proj_pts > (l5_pts_avg * 1.30):
+        proj_pts = l5_pts_avg * 1.30
+    if proj_minutes < 24:
+        proj_pts *= 0.90
+
+    # Confidence
+    base = 65
+    if proj_minutes >= 30:
+        base += 10
+    elif proj_minutes < 26:
+        base -= 12
+    if l5_pts_stdev <= 5:
+        base += 6
+    elif l5_pts_stdev > 7:
+        base -= 6
+    if score >= 4:
+        base += 4
+    elif score <= -4:
+        base -= 4
+    if has_usg:
+        if usg_pct >= 28.0:
+            base += 3
+        elif usg_pct < 20.0:
+            base -= 2
+    if days_rest == 0:
+        base -= 6
+    elif days_rest == 2:
+        base += 2
+    elif days_rest >= 3:
+        base -= 2
+    if dvp_code == 1:
+        base += 5
+    elif dvp_code == 2:
+        base -= 5
+
+    return score, proj_pts, max(50, min(95, base))
+
+
+if HAS_NUMBA:
+    _score_player_numba = njit(cache=True)(_score_player_kernel)
+
+    @njit(parallel=True, cache=True)
+    def _score_all_numba(
+        team_idx,
+        season_pts,
+        l5_pts_avg,
+        l5_pts_stdev,
+        proj_minutes,
+        recent_minutes_avg,
+        usg_pct,
+        dvp_code,
+        days_rest_by_team,
+        is_away_by_team,
+        pace_factor_by_team,
+        high_travel_by_team,
+    ):
+        """Score a flat batch of players; per-team context is indexed by team_idx."""
+        n = season_pts.shape[0]
+        scores = np.empty(n)
+        proj_pts = np.empty(n)
+        confidence = np.empty(n, dtype=np.int64)
+        # Each iteration writes only its own output slots, so prange is safe.
+        for i in prange(n):
+            t = team_idx[i]
+            score, pts, conf = _score_player_numba(
+                season_pts[i],
+                l5_pts_avg[i],
+                l5_pts_stdev[i],
+                proj_minutes[i],
+                recent_minutes_avg[i],
+                pace_factor_by_team[t],
+                usg_pct[i],
+                days_rest_by_team[t],
+                dvp_code[i],
+                is_away_by_team[t],
+                high_travel_by_team[t],
+            )
+            scores[i] = score
+            proj_pts[i] = pts
+            confidence[i] = conf
+        return scores, proj_pts, confidence
+
+
+_KERNEL_READY = False
+
+
+def _ensure_compiled() -> None:
+    """Compile (or load from cache) the numba kernel before the first game.
+
+    Called from main rather than at import so that importing the module,
+    or running --help, stays free of JIT work.
+    """
+    global _KERNEL_READY
+    if _KERNEL_READY or not HAS_NUMBA:
+        return
+    _score_all_numba(
+        np.zeros(1, dtype=np.int64),
+        np.full(1, 20.0),
+        np.full(1, 20.0),
+        np.full(1, 5.0),
+        np.full(1, 30.0),
+        np.full(1, 30.0),
+        np.full(1, 25.0),
+        np.zeros(1, dtype=np.int64),
+        np.ones(1, dtype=np.int64),
+        np.ones(1, dtype=np.bool_),
+        np.zeros(1),
+        np.zeros(1, dtype=np.bool_),
+    )
+    _KERNEL_READY = True
+
+
+@dataclass(frozen=True, slots=True)
+class _PlayerInputs:
+    """Per-player scoring inputs extracted from GAME_DATA."""
+
+    player: str
+    position: str
+    proj_minutes: float
+    recent_minutes_avg: float
+    season_pts: float
+    l5_pts_avg: float
+    l5_pts_stdev: float
+    usg_pct: Optional[float]
+    dvp_bucket: str
+
+
+# Composite ranking key: score is rounded to 0.001, so scaling by 1e6 keeps
+# every score step (>= 1000) above any realistic proj_pts tie-breaker.
+_SCORE_KEY_SCALE = 1e6
+
+
+class _ScoredRow(NamedTuple):
+    sort_key: float
+    points_outcome_score: float
+    proj_pts: float
+    row_idx: int
+
+
+_rank_key = operator.attrgetter("sort_key")
+
+
+def _score_player(
+    row: _PlayerInputs,
+    pace_factor: float,
+    days_rest: int,
+    is_away: bool,
+    is_b2b: bool,
+    high_travel: bool,
+) -> Tuple[float, float, int]:
+    """Pure-Python scoring path: (points_outcome_score, proj_pts, confidence)."""
+
+    # Calculate adjustments
+    environment_adj = _compute_environment_adj(pace_factor, row.proj_minutes)
+    minutes_role_adj = _compute_minutes_role_adj(row.proj_minutes, row.recent_minutes_avg)
+    form_adj = _compute_form_adj(row.l5_pts_avg, row.season_pts)
+    consistency_adj = _compute_consistency_adj(row.l5_pts_stdev)
+    usage_adj = _compute_usage_adj(row.usg_pct)
+    rest_adj = _compute_rest_adj(days_rest, is_away)
+    dvp_adj = _compute_dvp_adj(row.dvp_bucket)
+    fatigue = _fatigue_penalty(is_away=is_away, is_b2b=is_b2b, high_travel=high_travel)
+
+    # Compute total points outcome score
+    points_outcome_score = (
+        environment_adj
+        + minutes_role_adj
+        + form_adj
+        + consistency_adj
+        + usage_adj
+        + rest_adj
+        + dvp_adj
+        + fatigue
+    )
+
+    proj_pts = _project_points(
+        season_pts=row.season_pts,
+        l5_pts_avg=row.l5_pts_avg,
+        proj_minutes=row.proj_minutes,
+        recent_minutes_avg=row.recent_minutes_avg,
+        points_outcome_score=points_outcome_score,
+    )
+
+    conf = _confidence(
+        points_outcome_score=points_outcome_score,
+        proj_minutes=row.proj_minutes,
+        l5_pts_stdev=row.l5_pts_stdev,
+        usg_pct=row.usg_pct,
+        days_rest=days_rest,
+        dvp_bucket=row.dvp_bucket,
+    )
+
+    return points_outcome_score, proj_pts, conf
+
+
+def _score_batch(
+    team_rows: List[List[_PlayerInputs]],
+    days_rest_by_team: List[int],
+    is_away_by_team: List[bool],
+    b2b_by_team: List[bool],
+    pace_factor_by_team: List[float],
+    high_travel_by_team: List[bool],
+) -> List[List[Tuple[float, float, int]]]:
+    """Score every team's players in one pass.
+
+    Teams may come from any number of games; game-level context (pace
+    factor, travel) is passed per team. Returns per-team lists of
+    (points_outcome_score, proj_pts, confidence) aligned with `team_rows`.
+    With numba available all teams are flattened into one array batch and
+    scored in parallel.
+    """
+
+    if not HAS_NUMBA:
+        return [
+            [
+                _score_player(
+                    row,
+                    pace_factor_by_team[t],
+                    days_rest_by_team[t],
+                    is_away_by_team[t],
+                    b2b_by_team[t],
+                    high_travel_by_team[t],
+                )
+                for row in rows
+            ]
+            for t, rows in enumerate(team_rows)
+        ]
+
+    flat = [row for rows in team_rows for row in rows]
+    scores, proj_pts, confidence = _score_all_numba(
+        np.array([t for t, rows in enumerate(team_rows) for _ in rows], dtype=np.int64),
+        np.array([r.season_pts for r in flat], dtype=np.float64),
+        np.array([r.l5_pts_avg for r in flat], dtype=np.float64),
+        np.array([r.l5_pts_stdev for r in flat], dtype=np.float64),
+        np.array([r.proj_minutes for r in flat], dtype=np.float64),
+        np.array([r.recent_minutes_avg for r in flat], dtype=np.float64),
+        np.array(
+            [math.nan if r.usg_pct is None else r.usg_pct for r in flat], dtype=np.float64
+        ),
+        np.array([_DVP_CODES.get(r.dvp_bucket, 0) for r in flat], dtype=np.int64),
+        np.array(days_rest_by_team, dtype=np.int64),
+        np.array(is_away_by_team, dtype=np.bool_),
+        np.array(pace_factor_by_team, dtype=np.float64),
+        np.array(high_travel_by_team, dtype=np.bool_),
+    )
+    scored = list(zip(scores.tolist(), proj_pts.tolist(), confidence.tolist()))
+
+    # Rows are laid out team by team, so split back by each team's count.
+    out: List[List[Tuple[float, float, int]]] = []
+    start = 0
+    for rows in team_rows:
+        out.append(scored[start : start + len(rows)])
+        start += len(rows)
+    return out
+
+
+def _get_dvp_bucket(dvp: Dict[str, Any], position: str) -> str:
+    """Get DvP bucket for a player's position from the opponent's DvP table."""
     
     # Try exact position match first
     pos_upper = position.upper()
@@ -317,14 +675,28 @@ def _get_dvp_bucket(teams: Dict[str, Any], opp_abbr: str, position: str) -> str:
     return "AVERAGE"
 
 
-def build_candidates(
+@dataclass(slots=True)
+class _GameInputs:
+    """Scoring inputs for one game; per-team tuples are (away, home)."""
+
+    away_abbr: str
+    home_abbr: str
+    projected_game_pace: Optional[float]
+    high_travel: bool
+    days_rest: Tuple[int, int]
+    b2b: Tuple[bool, bool]
+    rows: Tuple[List[_PlayerInputs], List[_PlayerInputs]]
+    seen_norm: Tuple[Set[str], Set[str]]
+
+
+def _extract_game_inputs(
     payload: Dict[str, Any],
     away_abbr: str,
     home_abbr: str,
     *,
-    away_starters: Optional[List[str]] = None,
-    home_starters: Optional[List[str]] = None,
-) -> Tuple[List[Candidate], List[Candidate]]:
+    away_allowed_norm: Optional[FrozenSet[str]] = None,
+    home_allowed_norm: Optional[FrozenSet[str]] = None,
+) -> _GameInputs:
     teams = payload.get("teams") or {}
 
     away_team = teams.get(away_abbr) or {}
@@ -345,25 +717,16 @@ def build_candidates(
 
     high_travel = bool((payload.get("meta") or {}).get("high_travel", False))
 
-    away_allowed_norm = (
-        {_normalize_name_for_match(n) for n in away_starters} if away_starters else None
-    )
-    home_allowed_norm = (
-        {_normalize_name_for_match(n) for n in home_starters} if home_starters else None
-    )
-
-    def _team_candidates(
+    def _team_inputs(
         team_abbr: str,
-        opp_abbr: str,
-        is_away: bool,
-        allowed_norm: Optional[set[str]],
-    ) -> List[Candidate]:
+        opp_team: Dict[str, Any],
+        allowed_norm: Optional[FrozenSet[str]],
+    ) -> Tuple[List[_PlayerInputs], Set[str]]:
         team_players = (payload.get("players") or {}).get(team_abbr) or []
-        team_data = teams.get(team_abbr) or {}
-        b2b = bool(team_data.get("back_to_back", False))
-        days_rest = int(team_data.get("days_rest", 1))  # Default to 1 day rest
+        opp_dvp = opp_team.get("dvp") or {}
 
-        candidates: List[Candidate] = []
+        rows: List[_PlayerInputs] = []
+        seen_norm: Set[str] = set()
         for p in team_players:
             player_name = str(p.get("name") or "")
             player_norm = _normalize_name_for_match(player_name)
@@ -374,17 +737,28 @@ def build_candidates(
             if status in INACTIVE_STATUSES:
                 continue
 
-            proj_minutes, recent_minutes_avg = _project_minutes(p)
+            recent = p.get("recent") or _EMPTY
+            season = p.get("season") or _EMPTY
+
+            # Project minutes: if we have a meaningful recent sample, trust it;
+            # otherwise fall back to the season average.
+            recent_minutes_avg = _safe_float(recent.get("minutes_avg"), 0.0)
+            sample_size = int(recent.get("sample_size") or 0)
+            if sample_size >= 3 and recent_minutes_avg > 0:
+                proj_minutes = recent_minutes_avg
+            else:
+                proj_minutes = _safe_float(season.get("minutes"), 0.0) or recent_minutes_avg
+            proj_minutes = round(proj_minutes, 2)
+            recent_minutes_avg = round(recent_minutes_avg, 2)
             if allowed_norm is None and proj_minutes < 20:
                 continue
 
-            season = p.get("season") or {}
-            recent = p.get("recent") or {}
             position = str(p.get("position") or "")
 
             season_pts = _safe_float(season.get("pts"), 0.0)
-            l5_pts = _safe_float((recent.get("pts") or {}).get("avg"), 0.0)
-            l5_stdev = _safe_float((recent.get("pts") or {}).get("stdev"), 0.0)
+            recent_pts = recent.get("pts") or _EMPTY
+            l5_pts = _safe_float(recent_pts.get("avg"), 0.0)
+            l5_stdev = _safe_float(recent_pts.get("stdev"), 0.0)
             
             # Get usage rate from recent stats
             usg_pct = recent.get("usg_pct")
@@ -392,93 +766,217 @@ def build_candidates(
                 usg_pct = _safe_float(usg_pct, None)
             
             # Get DvP bucket for this player's position vs opponent
-            dvp_bucket = _get_dvp_bucket(teams, opp_abbr, position)
-
-            # Calculate adjustments
-            environment_adj = _compute_environment_adj(projected_game_pace, proj_minutes)
-            minutes_role_adj = _compute_minutes_role_adj(proj_minutes, recent_minutes_avg)
-            form_adj = _compute_form_adj(l5_pts, season_pts)
-            consistency_adj = _compute_consistency_adj(l5_stdev)
-            usage_adj = _compute_usage_adj(usg_pct)
-            rest_adj = _compute_rest_adj(days_rest, is_away)
-            dvp_adj = _compute_dvp_adj(dvp_bucket)
-            fatigue = _fatigue_penalty(is_away=is_away, is_b2b=b2b, high_travel=high_travel)
-
-            # Compute total points outcome score
-            points_outcome_score = (
-                environment_adj
-                + minutes_role_adj
-                + form_adj
-                + consistency_adj
-                + usage_adj
-                + rest_adj
-                + dvp_adj
-                + fatigue
-            )
+            dvp_bucket = _get_dvp_bucket(opp_dvp, position)
 
-            proj_pts = _project_points(
-                season_pts=season_pts,
-                l5_pts_avg=l5_pts,
-                proj_minutes=proj_minutes,
-                recent_minutes_avg=recent_minutes_avg,
-                points_outcome_score=points_outcome_score,
-            )
-
-            conf = _confidence(
-                points_outcome_score=points_outcome_score,
-                proj_minutes=proj_minutes,
-                l5_pts_stdev=l5_stdev,
-                usg_pct=usg_pct,
-                days_rest=days_rest,
-                dvp_bucket=dvp_bucket,
-            )
-
-            why_bits = []
-            if projected_game_pace is not None:
-                why_bits.append(f"pace={projected_game_pace:.1f}")
-            why_bits.append(f"min={proj_minutes:.1f}")
-            if season_pts > 0:
-                why_bits.append(f"season={season_pts:.1f}")
-            if l5_pts > 0:
-                why_bits.append(f"L5={l5_pts:.1f}")
-            if usg_pct is not None:
-                why_bits.append(f"usg={usg_pct:.1f}%")
-            why_bits.append(f"rest={days_rest}d")
-            if dvp_bucket != "AVERAGE":
-                why_bits.append(f"dvp={dvp_bucket}")
-            why_bits.append(f"score={points_outcome_score:.2f}")
-
-            candidates.append(
-                Candidate(
-                    player=str(p.get("name") or ""),
-                    team=team_abbr,
-                    opponent=opp_abbr,
+            rows.append(
+                _PlayerInputs(
+                    player=player_name,
                     position=position,
                     proj_minutes=proj_minutes,
+                    recent_minutes_avg=recent_minutes_avg,
                     season_pts=season_pts,
                     l5_pts_avg=l5_pts,
                     l5_pts_stdev=l5_stdev,
                     usg_pct=usg_pct,
-                    days_rest=days_rest,
                     dvp_bucket=dvp_bucket,
-                    points_outcome_score=round(points_outcome_score, 3),
-                    proj_pts=proj_pts,
-                    confidence_0_100=conf,
-                    why_summary="; ".join(why_bits),
                 )
             )
+            seen_norm.add(player_norm)
+        return rows, seen_norm
+
+    team_context = (away_team, home_team)
+
+    away_rows, away_seen_norm = _team_inputs(away_abbr, home_team, allowed_norm=away_allowed_norm)
+    home_rows, home_seen_norm = _team_inputs(home_abbr, away_team, allowed_norm=home_allowed_norm)
+
+    return _GameInputs(
+        away_abbr=away_abbr,
+        home_abbr=home_abbr,
+        projected_game_pace=projected_game_pace,
+        high_travel=high_travel,
+        days_rest=tuple(int(t.get("days_rest", 1)) for t in team_context),  # Default to 1 day rest
+        b2b=tuple(bool(t.get("back_to_back", False)) for t in team_context),
+        rows=(away_rows, home_rows),
+        seen_norm=(away_seen_norm, home_seen_norm),
+    )
 
-        candidates.sort(key=lambda c: (c.points_outcome_score, c.proj_pts), reverse=True)
-        return candidates
 
-    away_candidates = _team_candidates(
-        away_abbr, home_abbr, is_away=True, allowed_norm=away_allowed_norm
-    )
-    home_candidates = _team_candidates(
-        home_abbr, away_abbr, is_away=False, allowed_norm=home_allowed_norm
+def _team_candidates(
+    team_abbr: str,
+    opp_abbr: str,
+    days_rest: int,
+    projected_game_pace: Optional[float],
+    rows: List[_PlayerInputs],
+    scored: List[Tuple[float, float, int]],
+    max_candidates: Optional[int],
+) -> List[Candidate]:
+    # Rank on the (rounded) score/projection first; only the survivors
+    # pay for why_summary formatting and Candidate construction.
+    ranked: List[Any] = [None] * len(scored)
+    for idx, (points_outcome_score, proj_pts, _) in enumerate(scored):
+        points_outcome_score = round(points_outcome_score, 3)
+        proj_pts = round(proj_pts, 2)
+        ranked[idx] = _ScoredRow(
+            points_outcome_score * _SCORE_KEY_SCALE + proj_pts,
+            points_outcome_score,
+            proj_pts,
+            idx,
+        )
+    if max_candidates is None:
+        ranked.sort(key=_rank_key, reverse=True)
+    else:
+        ranked = heapq.nlargest(max_candidates, ranked, key=_rank_key)
+
+    pace_bit = "pace=%.1f" % projected_game_pace if projected_game_pace is not None else ""
+    rest_bit = "rest=%dd" % days_rest
+
+    # At most max_candidates slots; filled in rank order.
+    candidates: List[Any] = [None] * len(ranked)
+    for slot, ranked_row in enumerate(ranked):
+        row = rows[ranked_row.row_idx]
+        points_outcome_score, _, conf = scored[ranked_row.row_idx]
+
+        why_bits = (
+            pace_bit,
+            "min=%.1f" % row.proj_minutes,
+            "season=%.1f" % row.season_pts if row.season_pts > 0 else "",
+            "L5=%.1f" % row.l5_pts_avg if row.l5_pts_avg > 0 else "",
+            "usg=%.1f%%" % row.usg_pct if row.usg_pct is not None else "",
+            rest_bit,
+            "dvp=" + row.dvp_bucket if row.dvp_bucket != "AVERAGE" else "",
+            "score=%.2f" % points_outcome_score,
+        )
+
+        candidates[slot] = Candidate(
+            player=row.player,
+            team=team_abbr,
+            opponent=opp_abbr,
+            position=row.position,
+            proj_minutes=row.proj_minutes,
+            season_pts=row.season_pts,
+            l5_pts_avg=row.l5_pts_avg,
+            l5_pts_stdev=row.l5_pts_stdev,
+            usg_pct=row.usg_pct,
+            days_rest=days_rest,
+            dvp_bucket=row.dvp_bucket,
+            points_outcome_score=ranked_row.points_outcome_score,
+            proj_pts=ranked_row.proj_pts,
+            confidence_0_100=conf,
+            why_summary="; ".join([bit for bit in why_bits if bit]),
+        )
+
+    return candidates
+
+
+def score_slate(
+    games: List[Dict[str, Any]],
+    *,
+    max_candidates: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Build candidates for several games with a single batched scoring call.
+
+    Each entry holds `build_candidates` arguments: `payload`, `away_abbr`,
+    `home_abbr` and optionally `away_allowed_norm`/`home_allowed_norm`.
+    Returns one `build_candidates` result per game, in order. With
+    `return_exceptions`, a game whose inputs cannot be extracted gets the
+    exception in its slot and the rest of the slate is still scored.
+    """
+
+    prepared: List[_GameInputs] = []
+    failed: Dict[int, Exception] = {}
+    for g, game in enumerate(games):
+        try:
+            prepared.append(_extract_game_inputs(**game))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            failed[g] = e
+
+    # Teams are laid out (away, home) per game in slate order.
+    team_rows: List[List[_PlayerInputs]] = []
+    days_rest_by_team: List[int] = []
+    is_away_by_team: List[bool] = []
+    b2b_by_team: List[bool] = []
+    pace_factor_by_team: List[float] = []
+    high_travel_by_team: List[bool] = []
+    for game in prepared:
+        team_rows.extend(game.rows)
+        days_rest_by_team.extend(game.days_rest)
+        is_away_by_team.extend((True, False))
+        b2b_by_team.extend(game.b2b)
+        # Pace thresholds are evaluated once per game, not per player; with no
+        # pace data the factor is 0 and the environment term is skipped.
+        pace_factor = _pace_env_factor(game.projected_game_pace)
+        pace_factor_by_team.extend((pace_factor, pace_factor))
+        high_travel_by_team.extend((game.high_travel, game.high_travel))
+
+    scored = _score_batch(
+        team_rows,
+        days_rest_by_team,
+        is_away_by_team,
+        b2b_by_team,
+        pace_factor_by_team,
+        high_travel_by_team,
     )
 
-    return away_candidates, home_candidates
+    results = []
+    for g, game in enumerate(prepared):
+        away_candidates = _team_candidates(
+            game.away_abbr,
+            game.home_abbr,
+            game.days_rest[0],
+            game.projected_game_pace,
+            game.rows[0],
+            scored[2 * g],
+            max_candidates,
+        )
+        home_candidates = _team_candidates(
+            game.home_abbr,
+            game.away_abbr,
+            game.days_rest[1],
+            game.projected_game_pace,
+            game.rows[1],
+            scored[2 * g + 1],
+            max_candidates,
+        )
+        results.append((away_candidates, home_candidates, *game.seen_norm))
+
+    if failed:
+        scored_results = iter(results)
+        results = [failed[g] if g in failed else next(scored_results) for g in range(len(games))]
+    return results
+
+
+def build_candidates(
+    payload: Dict[str, Any],
+    away_abbr: str,
+    home_abbr: str,
+    *,
+    away_allowed_norm: Optional[FrozenSet[str]] = None,
+    home_allowed_norm: Optional[FrozenSet[str]] = None,
+    max_candidates: Optional[int] = None,
+) -> Tuple[List[Candidate], List[Candidate], Set[str], Set[str]]:
+    """Build sorted away/home candidates.
+
+    `away_allowed_norm`/`home_allowed_norm` are optional starter filters of
+    names already passed through `_normalize_name_for_match`. Also returns
+    the normalized names of every away/home candidate so callers can
+    validate starters without re-normalizing. When `max_candidates` is set,
+    only that many top-ranked candidates per team are materialized.
+    """
+    return score_slate(
+        [
+            {
+                "payload": payload,
+                "away_abbr": away_abbr,
+                "home_abbr": home_abbr,
+                "away_allowed_norm": away_allowed_norm,
+                "home_allowed_norm": home_allowed_norm,
+            }
+        ],
+        max_candidates=max_candidates,
+    )[0]
 
 
 def select_top_n_unique(candidates: List[Candidate], n: int) -> List[Candidate]:
@@ -494,12 +992,55 @@ def select_top_n_unique(candidates: List[Candidate], n: int) -> List[Candidate]:
     return selected
 
 
+def _pick_dict(p: Candidate, primary_stat: str = "PTS") -> Dict[str, Any]:
+    return {
+        "player": p.player,
+        "team": p.team,
+        "opponent": p.opponent,
+        "primary_stat": primary_stat,
+        "proj_value": p.proj_pts,
+        "confidence_0_100": p.confidence_0_100,
+        "why_summary": p.why_summary,
+    }
+
+
+def _allowed_norm(names: List[str]) -> Optional[FrozenSet[str]]:
+    if not names:
+        return None
+    return frozenset(_normalize_name_for_match(n) for n in names)
+
+
+def _game_picks(
+    result: Tuple[List[Candidate], List[Candidate], Set[str], Set[str]],
+    away_allowed_norm: Optional[FrozenSet[str]],
+    home_allowed_norm: Optional[FrozenSet[str]],
+) -> Dict[str, Any]:
+    away_candidates, home_candidates, away_seen_norm, home_seen_norm = result
+
+    if away_allowed_norm:
+        missing = sorted(away_allowed_norm - away_seen_norm)
+        if missing:
+            raise RuntimeError(f"Away starters not found in GAME_DATA: {missing}")
+
+    if home_allowed_norm:
+        missing = sorted(home_allowed_norm - home_seen_norm)
+        if missing:
+            raise RuntimeError(f"Home starters not found in GAME_DATA: {missing}")
+    away_picks = select_top_n_unique(away_candidates, 3)
+    home_picks = select_top_n_unique(home_candidates, 3)
+
+    return {
+        "away_picks": [_pick_dict(p) for p in away_picks],
+        "home_picks": [_pick_dict(p) for p in home_picks],
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
-    parser.add_argument("--game-date", required=True, help="Game date YYYY-MM-DD")
-    parser.add_argument("--away", required=True, help="Away team abbreviation, e.g. BOS")
-    parser.add_argument("--home", required=True, help="Home team abbreviation, e.g. MIN")
-    parser.add_argument("--season", type=int, required=True, help="Season year, e.g. 2025")
+    parser.add_argument("--game-date", default=None, help="Game date YYYY-MM-DD")
+    parser.add_argument("--away", default=None, help="Away team abbreviation, e.g. BOS")
+    parser.add_argument("--home", default=None, help="Home team abbreviation, e.g. MIN")
+    parser.add_argument("--season", type=int, default=None, help="Season year, e.g. 2025")
     parser.add_argument(
         "--away-starters",
         default=None,
@@ -510,69 +1051,123 @@ def main() -> None:
         default=None,
         help="Optional comma-separated home starter names (filters output).",
     )
-    args = parser.parse_args()
-
-    game_date = datetime.fromisoformat(args.game_date).replace(tzinfo=timezone.utc)
-    away = args.away.upper()
-    home = args.home.upper()
-
-    away_starters = _parse_csv_names(args.away_starters)
-    home_starters = _parse_csv_names(args.home_starters)
-
-    payload = build_points_game_payload(game_date, away, home, args.season)
-
-    away_candidates, home_candidates = build_candidates(
-        payload,
-        away,
-        home,
-        away_starters=away_starters or None,
-        home_starters=home_starters or None,
+    parser.add_argument(
+        "--slate",
+        default=None,
+        help=(
+            "Path to a JSON list of games to score in one batch. Each entry has "
+            "game_date, away, home and optional season/away_starters/home_starters "
+            "(--season is the default season)."
+        ),
     )
+    args = parser.parse_args()
 
-    if away_starters:
-        expected = {_normalize_name_for_match(n) for n in away_starters}
-        got = {_normalize_name_for_match(c.player) for c in away_candidates}
-        missing = sorted(expected - got)
-        if missing:
-            raise RuntimeError(f"Away starters not found in GAME_DATA: {missing}")
-
-    if home_starters:
-        expected = {_normalize_name_for_match(n) for n in home_starters}
-        got = {_normalize_name_for_match(c.player) for c in home_candidates}
-        missing = sorted(expected - got)
-        if missing:
-            raise RuntimeError(f"Home starters not found in GAME_DATA: {missing}")
-    away_picks = select_top_n_unique(away_candidates, 3)
-    home_picks = select_top_n_unique(home_candidates, 3)
-
-    out = {
-        "away_picks": [
+    if args.slate:
+        with open(args.slate, "r") as f:
+            specs = json.load(f)
+    else:
+        missing_args = [
+            flag
+            for flag, value in (
+                ("--game-date", args.game_date),
+                ("--away", args.away),
+                ("--home", args.home),
+                ("--season", args.season),
+            )
+            if value is None
+        ]
+        if missing_args:
+            parser.error("the following arguments are required: " + ", ".join(missing_args))
+        specs = [
             {
-                "player": p.player,
-                "team": p.team,
-                "opponent": p.opponent,
-                "primary_stat": "PTS",
-                "proj_value": p.proj_pts,
-                "confidence_0_100": p.confidence_0_100,
-                "why_summary": p.why_summary,
+                "game_date": args.game_date,
+                "away": args.away,
+                "home": args.home,
+                "away_starters": args.away_starters,
+                "home_starters": args.home_starters,
             }
-            for p in away_picks
-        ],
-        "home_picks": [
+        ]
+
+    # Compile up front so the first game doesn't pay for it.
+    _ensure_compiled()
+
+    games: List[Dict[str, Any]] = []
+    # A slate records a failing game as an error entry and scores the rest;
+    # a single game still raises.
+    failed: Dict[int, Exception] = {}
+    for i, spec in enumerate(specs):
+        away = str(spec["away"]).upper()
+        home = str(spec["home"]).upper()
+        season = spec.get("season", args.season)
+        if season is None:
+            parser.error(f"{away}@{home}: no season in slate entry and no --season given")
+
+        # Starters may be a comma-separated string (CLI) or a list (slate file).
+        away_starters = spec.get("away_starters")
+        home_starters = spec.get("home_starters")
+        if not isinstance(away_starters, list):
+            away_starters = _parse_csv_names(away_starters)
+        if not isinstance(home_starters, list):
+            home_starters = _parse_csv_names(home_starters)
+
+        # Normalized once; shared by the candidate filter and the validation below.
+        game: Dict[str, Any] = {
+            "away_abbr": away,
+            "home_abbr": home,
+            "away_allowed_norm": _allowed_norm(away_starters),
+            "home_allowed_norm": _allowed_norm(home_starters),
+        }
+        games.append(game)
+        try:
+            # build_points_game_payload only uses .date() and day arithmetic,
+            # so a naive datetime is enough.
+            game_date = datetime.fromisoformat(spec["game_date"])
+            game["payload"] = build_points_game_payload(game_date, away, home, int(season))
+        except Exception as e:
+            if not args.slate:
+                raise
+            failed[i] = e
+
+    # 6 leaves headroom over the 3 picks for duplicate names.
+    results = iter(
+        score_slate(
+            [game for i, game in enumerate(games) if i not in failed],
+            max_candidates=6,
+            return_exceptions=bool(args.slate),
+        )
+    )
+
+    picks: List[Dict[str, Any]] = []
+    for i, game in enumerate(games):
+        try:
+            result = failed[i] if i in failed else next(results)
+            if isinstance(result, Exception):
+                raise result
+            picks.append(_game_picks(result, game["away_allowed_norm"], game["home_allowed_norm"]))
+        except Exception as e:
+            if not args.slate:
+                raise
+            picks.append({"error": f"{type(e).__name__}: {e}"})
+
+    if args.slate:
+        out: Any = [
             {
-                "player": p.player,
-                "team": p.team,
-                "opponent": p.opponent,
-                "primary_stat": "PTS",
-                "proj_value": p.proj_pts,
-                "confidence_0_100": p.confidence_0_100,
-                "why_summary": p.why_summary,
+                "game_date": spec["game_date"],
+                "away": game["away_abbr"],
+                "home": game["home_abbr"],
+                **game_picks,
             }
-            for p in home_picks
-        ],
-    }
+            for spec, game, game_picks in zip(specs, games, picks)
+        ]
+    else:
+        out = picks[0]
 
-    print(json.dumps(out, indent=2))
+    if HAS_ORJSON:
+        sys.stdout.buffer.write(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        json.dump(out, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
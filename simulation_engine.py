@@ -7,8 +7,9 @@ This script:
 1. Reads GAME_DATA JSON from fetch_points_game_data.py (stdin or file)
 2. Accepts --baselines argument with player projection lines
 3. Uses GOAT advanced metrics (Usage%, TS%, DRtg) for superior adjustments
-4. Runs 10,000-iteration Monte Carlo simulation for each starter
-5. Calculates Win Probability % of clearing the baseline line
+4. Models each starter's points as Normal(adjusted mean, L5 stdev)
+5. Calculates Win Probability % of clearing the baseline line (closed-form
+   normal CDF by default, 10,000-iteration Monte Carlo with --no-exact-cdf)
 6. Outputs JSON with simulation results and GOAT factors
 
 GOAT Features:
@@ -42,15 +43,24 @@ Usage:
 
 Requirements:
   - numpy (for efficient Monte Carlo simulation)
+  - numba (optional, compiles the adjustment-score kernel)
+  - orjson (optional, faster JSON input/output)
+  - scipy (optional, vectorized inverse normal CDF for --qmc)
+  - ijson (optional, incremental GAME_DATA parsing for --stream-input)
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import math
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 try:
     import numpy as np
@@ -59,14 +69,47 @@ except ImportError:
     HAS_NUMPY = False
     import random
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    from scipy.special import ndtri
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    from statistics import NormalDist
+
 # Default standard deviation when L5 stdev is unavailable
 DEFAULT_STDEV = 6.0
 
 # Number of Monte Carlo iterations
 DEFAULT_ITERATIONS = 10000
 
+_SQRT2 = math.sqrt(2.0)
 
-@dataclass
+# Shared PCG64 generator for the sampling path (avoids legacy global state)
+_RNG = np.random.default_rng() if HAS_NUMPY else None
+
+# DvP bucket encoding for the numeric adjustment kernel (anything else = AVERAGE)
+DVP_CODES = {"WEAK": -1, "AVERAGE": 0, "STRONG": 1}
+
+
+@dataclass(frozen=True, slots=True)
 class SimulationResult:
     """Result of Monte Carlo simulation for a single player.
     
@@ -76,12 +119,12 @@ class SimulationResult:
     team: str
     position: str
     baseline_line: float
-    adjusted_mean: float
+    adjusted_mean: float  # unrounded; rounded to 2dp on output
     stdev: float
     simulated_mean: float
     win_prob_pct: float
-    iterations: int
-    edge_pts: float  # adjusted_mean - baseline_line
+    iterations: int  # 0 when win_prob_pct came from the closed-form CDF
+    edge_pts: float  # round(adjusted_mean, 2) - baseline_line, to 2dp
     is_starter: bool = True
     # GOAT Advanced Factors
     goat_factors: Optional[Dict[str, Any]] = None
@@ -89,6 +132,13 @@ class SimulationResult:
 
 def _safe_float(x: Any, default: float = 0.0) -> float:
     """Safely convert to float with default."""
+    # JSON numbers are almost always float/int already; skip the try/except.
+    if type(x) is float:
+        return x
+    if type(x) is int:
+        return float(x)
+    if x is None:
+        return default
     try:
         return float(x)
     except Exception:
@@ -100,119 +150,87 @@ def _cap(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
+_NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+# Deletes "." and "," in a single str.translate pass
+_NAME_STRIP_TABLE = str.maketrans("", "", ".,")
+
+
+@lru_cache(maxsize=4096)
 def _normalize_name_for_match(name: str) -> str:
     """Normalize player names for fuzzy matching."""
-    s = name.strip().lower()
-    for ch in [".", ","]:
-        s = s.replace(ch, "")
-    parts = [p for p in s.split() if p]
+    s = name.strip().lower().translate(_NAME_STRIP_TABLE)
+    parts = s.split()
     # Remove common suffixes
-    suffixes = {"jr", "sr", "ii", "iii", "iv", "v"}
-    if parts and parts[-1] in suffixes:
+    if parts and parts[-1] in _NAME_SUFFIXES:
         parts = parts[:-1]
     return " ".join(parts)
 
 
-def compute_adjustment_score(
-    player: Dict[str, Any],
-    team_data: Dict[str, Any],
-    opp_team_data: Dict[str, Any],
+# Staircase rules as (thresholds, adjustments): a value gets adjustments[i]
+# where i is the number of thresholds it is >= to. Strict ">" boundaries are
+# written as the next float above the cutoff.
+_MINUTES_STEPS = ((26.0, 30.0, 34.0), (-3.3, 0.0, 0.6, 1.2))
+_PACE_STEPS = ((math.nextafter(98.0, math.inf), 104.0), (-2.7, 0.0, 2.7))
+_USAGE_STEPS = ((20.0, 28.0), (-1.0, 0.0, 1.2))
+_TS_STEPS = ((0.52, 0.58, 0.62), (-0.5, 0.0, 0.5, 1.0))
+_DRTG_STEPS = (
+    (math.nextafter(108.0, math.inf), math.nextafter(112.0, math.inf), 114.0, 118.0),
+    (-2.0, -1.0, 0.0, 0.8, 1.7),
+)
+_CLUTCH_STEPS = ((1.0, 2.5, 4.0), (-0.5, 0.0, 0.5, 1.0))
+_RANK_STEPS = (
+    (math.nextafter(10.0, math.inf), math.nextafter(25.0, math.inf), 100.0),
+    (1.4, 0.5, 0.0, -0.5),
+)
+
+
+def _staircase(value: float, thresholds: Tuple[float, ...], adjustments: Tuple[float, ...]) -> float:
+    """Look up the adjustment for value in a staircase table."""
+    i = 0
+    for t in thresholds:
+        if value < t:
+            break
+        i += 1
+    return adjustments[i]
+
+
+def _compute_adjustment_numeric(
+    season_pts: float,
+    l5_pts_avg: float,
+    l5_pts_stdev: float,
+    proj_minutes: float,
+    sample_size: int,
+    pace: float,
+    usg: float,
+    ts: float,
+    drtg: float,
+    days_rest: int,
     is_away: bool,
-    projected_game_pace: Optional[float],
-) -> Tuple[float, float, float, Dict[str, Any]]:
+    clutch: float,
+    rank: float,
+    dvp_code: int,
+) -> float:
     """
-    Compute adjustment score for a player using GOAT All-Star logic.
-    
-    GOAT Enhanced: Prioritizes official advanced metrics (Usage%, TS%, DRtg)
-    and includes clutch scoring and league rank adjustments.
+    Numeric core of compute_adjustment_score (sections A-J).
     
-    Returns: (adjustment_score, proj_minutes, l5_stdev, goat_factors)
+    Optional inputs (pace, usg, ts, clutch, rank) are NaN when missing;
+    dvp_code uses DVP_CODES. Compiled with numba when available.
     """
-    season = player.get("season") or {}
-    recent = player.get("recent") or {}
-    
-    # Extract stats
-    season_pts = _safe_float(season.get("pts"), 0.0)
-    season_minutes = _safe_float(season.get("minutes"), 0.0)
-    
-    l5_pts_avg = _safe_float((recent.get("pts") or {}).get("avg"), 0.0)
-    l5_pts_stdev = _safe_float((recent.get("pts") or {}).get("stdev"), DEFAULT_STDEV)
-    l5_minutes_avg = _safe_float(recent.get("minutes_avg"), 0.0)
-    sample_size = int(recent.get("sample_size") or 0)
-    
-    # GOAT Advanced Stats - Prioritize season (official) over recent (estimated)
-    usg_pct = season.get("usg_pct") or recent.get("usg_pct")
-    ts_pct = season.get("ts_pct") or recent.get("ts_pct")
-    off_rating = season.get("off_rating") or recent.get("off_rating")
-    
-    # GOAT Player-level advanced metrics
-    clutch_pts_avg = player.get("clutch_pts_avg")
-    pts_league_rank = player.get("pts_league_rank")
-    is_starter = player.get("is_starter", False)
-    
-    # Team Advanced (GOAT Upgrade) - Use official standings data
-    opp_adv = opp_team_data.get("advanced") or {}
-    opp_drtg = _safe_float(opp_adv.get("defensive_rating"), 0.0)
-    opp_nrtg = _safe_float(opp_adv.get("net_rating"), 0.0)
-    opp_pace_official = opp_team_data.get("pace_official") or opp_adv.get("pace")
-    
-    # Project minutes
-    if sample_size >= 3 and l5_minutes_avg > 0:
-        proj_minutes = l5_minutes_avg
-    else:
-        proj_minutes = season_minutes or l5_minutes_avg
-    
-    # Get team context
-    days_rest = int(team_data.get("days_rest", 1))
-    
-    # Get DvP bucket for this player's position (fallback if DRtg unavailable)
-    position = str(player.get("position") or "").upper()
-    dvp = opp_team_data.get("dvp") or {}
-    dvp_bucket = "AVERAGE"
-    
-    if position in dvp:
-        dvp_bucket = str(dvp[position].get("bucket", "AVERAGE"))
-    elif "-" in position:
-        for part in position.split("-"):
-            if part in dvp:
-                dvp_bucket = str(dvp[part].get("bucket", "AVERAGE"))
-                break
-    
-    # Track GOAT factors for output
-    goat_factors: Dict[str, Any] = {
-        "usage_pct": _safe_float(usg_pct) if usg_pct else None,
-        "ts_pct": _safe_float(ts_pct) if ts_pct else None,
-        "off_rating": _safe_float(off_rating) if off_rating else None,
-        "opp_drtg": opp_drtg if opp_drtg > 0 else None,
-        "opp_nrtg": opp_nrtg,
-        "clutch_ppg": _safe_float(clutch_pts_avg) if clutch_pts_avg else None,
-        "league_rank": pts_league_rank,
-        "is_starter": is_starter,
-        "days_rest": days_rest,
-        "dvp_bucket": dvp_bucket,
-    }
-    
     # Calculate adjustments (matching prompt2.0.md GOAT rules)
     adjustment_score = 0.0
     
     # A. Minutes & Role Stability (Dec 31 patch)
-    if proj_minutes >= 34:
-        minutes_adj = 1.2
-    elif proj_minutes >= 30:
-        minutes_adj = 0.6
-    elif proj_minutes >= 26:
-        minutes_adj = 0.0
-    else:
-        minutes_adj = -3.3
-    
+    minutes_adj = _staircase(proj_minutes, _MINUTES_STEPS[0], _MINUTES_STEPS[1])
     if sample_size < 3:
         minutes_adj *= 0.5
     adjustment_score += minutes_adj
     
     # B. Recent Form (capped, Jan 4 patch)
+    form_adj = 0.0
     if season_pts > 0:
         form_raw = ((l5_pts_avg - season_pts) / season_pts) * 14.5
-        form_adj = _cap(form_raw, -5.0, 5.0)
+        form_adj = max(-5.0, min(5.0, form_raw))
     adjustment_score += form_adj
     
     # C. Consistency / Volatility (Jan 1 patch)
@@ -224,56 +242,27 @@ def compute_adjustment_score(
         consistency_adj = -1.7  # Increased penalty for volatile players
     adjustment_score += consistency_adj
     
-    # D. Pace Environment (Jan 4 patch)
-    if projected_game_pace is not None:
-        if projected_game_pace >= 104:
-            pace_adj = 2.7
-        elif projected_game_pace <= 98:
-            pace_adj = -2.7
-        else:
-            pace_adj = 0.0
-    else:
-        pace_adj = 0.0
-    adjustment_score += pace_adj
-    
-    # E. Usage Rate (GOAT Official Data)
-    usage_adj = 0.0
-    if usg_pct is not None:
-        usg_pct_val = _safe_float(usg_pct, 0.0)
-        if usg_pct_val >= 28.0:
-            usage_adj = 1.2  # Primary scorer (Dec 28 patch)
-        elif usg_pct_val < 20.0:
-            usage_adj = -1.0  # Role player
-    adjustment_score += usage_adj
+    # D. Pace Environment (Jan 4 patch): <= 98 slow, >= 104 fast
+    if not math.isnan(pace):
+        adjustment_score += _staircase(pace, _PACE_STEPS[0], _PACE_STEPS[1])
+    
+    # E. Usage Rate (GOAT Official Data): < 20 role player, >= 28 primary scorer
+    if not math.isnan(usg):
+        adjustment_score += _staircase(usg, _USAGE_STEPS[0], _USAGE_STEPS[1])
     
     # F. True Shooting % (GOAT Official Data)
-    if ts_pct is not None:
-        ts_pct_val = _safe_float(ts_pct, 0.0)
-        if ts_pct_val >= 0.62:
-            ts_adj = 1.0  # Elite efficiency
-        elif ts_pct_val >= 0.58:
-            ts_adj = 0.5  # Above average
-        elif ts_pct_val < 0.52:
-            ts_adj = -0.5  # Below average
-        else:
-            ts_adj = 0.0
-        adjustment_score += ts_adj
+    if not math.isnan(ts):
+        adjustment_score += _staircase(ts, _TS_STEPS[0], _TS_STEPS[1])
     
     # G. Advanced Matchup (GOAT Upgrade - Defensive Rating from standings, Jan 4 patch)
-    if opp_drtg > 0:
-        if opp_drtg >= 118:  # Bottom 10 Defense
-            adjustment_score += 1.7
-        elif opp_drtg >= 114:  # Below avg defense
-            adjustment_score += 0.8
-        elif opp_drtg <= 108:  # Top 5 Defense
-            adjustment_score -= 2.0
-        elif opp_drtg <= 112:  # Above avg defense
-            adjustment_score -= 1.0
+    if drtg > 0:
+        # <= 108 top 5, <= 112 above avg, >= 114 below avg, >= 118 bottom 10
+        adjustment_score += _staircase(drtg, _DRTG_STEPS[0], _DRTG_STEPS[1])
     else:
         # Fallback to DvP if DRtg unavailable
-        if dvp_bucket == "WEAK":
+        if dvp_code == -1:
             adjustment_score += 1.7
-        elif dvp_bucket == "STRONG":
+        elif dvp_code == 1:
             adjustment_score -= 2.0
     
     # H. Days of Rest (Jan 1 patch - reduced optimal recovery)
@@ -288,31 +277,186 @@ def compute_adjustment_score(
     adjustment_score += rest_adj
     
     # I. Clutch Scoring (GOAT - from play_by_play)
-    if clutch_pts_avg is not None:
-        clutch_val = _safe_float(clutch_pts_avg, 0.0)
-        if clutch_val >= 4.0:
-            clutch_adj = 1.0  # Clutch performer
-        elif clutch_val >= 2.5:
-            clutch_adj = 0.5  # Reliable in clutch
-        elif clutch_val < 1.0:
-            clutch_adj = -0.5  # Struggles in clutch
-        else:
-            clutch_adj = 0.0
-        adjustment_score += clutch_adj
-    
-    # J. League Scoring Rank (GOAT - from leaders)
-    if pts_league_rank is not None:
-        if pts_league_rank <= 10:
-            rank_adj = 1.4  # Top 10 scorer (Jan 3 patch)
-        elif pts_league_rank <= 25:
-            rank_adj = 0.5  # Top 25 scorer
-        elif pts_league_rank >= 100:
-            rank_adj = -0.5  # Low volume
+    if not math.isnan(clutch):
+        adjustment_score += _staircase(clutch, _CLUTCH_STEPS[0], _CLUTCH_STEPS[1])
+    
+    # J. League Scoring Rank (GOAT - from leaders): <= 10, <= 25, >= 100
+    if not math.isnan(rank):
+        adjustment_score += _staircase(rank, _RANK_STEPS[0], _RANK_STEPS[1])
+    
+    return adjustment_score
+
+
+if HAS_NUMBA:
+    # No fastmath: missing inputs are NaN sentinels checked with isnan
+    _staircase = njit(cache=True)(_staircase)
+    _compute_adjustment_numeric = njit(cache=True)(_compute_adjustment_numeric)
+
+
+class PlayerContext(NamedTuple):
+    """Per-player stats extracted once while scoring, reused for the projection."""
+    season_pts: float
+    l5_pts_avg: float
+    l5_minutes_avg: float
+    proj_minutes: float
+    l5_stdev: float
+
+
+# scorer(player) -> (adjustment_score, context, goat_factors)
+AdjustmentScorer = Callable[[Dict[str, Any]], Tuple[float, PlayerContext, Optional[Dict[str, Any]]]]
+
+
+def _dvp_bucket_for_position(position: str, dvp: Dict[str, Any]) -> str:
+    """Opponent DvP bucket for a position, trying each part of hybrids (e.g. G-F)."""
+    if position in dvp:
+        return str(dvp[position].get("bucket", "AVERAGE"))
+    if "-" in position:
+        for part in position.split("-"):
+            if part in dvp:
+                return str(dvp[part].get("bucket", "AVERAGE"))
+    return "AVERAGE"
+
+
+def make_adjustment_scorer(
+    team_data: Dict[str, Any],
+    opp_team_data: Dict[str, Any],
+    is_away: bool,
+    projected_game_pace: Optional[float],
+    include_factors: bool = True,
+) -> AdjustmentScorer:
+    """
+    Specialize compute_adjustment_score for one side of a game.
+    
+    Team-level context (rest, opponent ratings, DvP table, game pace) is
+    extracted once and bound as closure locals, so the returned scorer
+    only reads the player dict. DvP buckets are memoized per position.
+    With include_factors=False the goat_factors dict is not built and
+    None is returned in its place.
+    
+    Returns: scorer(player) -> (adjustment_score, context, goat_factors)
+    """
+    # Team Advanced (GOAT Upgrade) - Use official standings data
+    opp_adv = opp_team_data.get("advanced") or {}
+    opp_drtg = _safe_float(opp_adv.get("defensive_rating"), 0.0)
+    opp_nrtg = _safe_float(opp_adv.get("net_rating"), 0.0)
+    opp_drtg_factor = opp_drtg if opp_drtg > 0 else None
+    
+    # Get team context
+    days_rest = int(team_data.get("days_rest", 1))
+    away = bool(is_away)
+    pace = math.nan if projected_game_pace is None else float(projected_game_pace)
+    
+    dvp = opp_team_data.get("dvp") or {}
+    dvp_buckets: Dict[str, str] = {}
+    
+    def score(player: Dict[str, Any]) -> Tuple[float, PlayerContext, Optional[Dict[str, Any]]]:
+        season = player.get("season") or {}
+        recent = player.get("recent") or {}
+        recent_pts = recent.get("pts") or {}
+        
+        # Extract stats
+        season_pts = _safe_float(season.get("pts"), 0.0)
+        season_minutes = _safe_float(season.get("minutes"), 0.0)
+        
+        l5_pts_avg = _safe_float(recent_pts.get("avg"), 0.0)
+        l5_pts_stdev = _safe_float(recent_pts.get("stdev"), DEFAULT_STDEV)
+        l5_minutes_avg = _safe_float(recent.get("minutes_avg"), 0.0)
+        sample_size = int(recent.get("sample_size") or 0)
+        
+        # GOAT Advanced Stats - Prioritize season (official) over recent (estimated)
+        usg_pct = season.get("usg_pct") or recent.get("usg_pct")
+        ts_pct = season.get("ts_pct") or recent.get("ts_pct")
+        
+        # GOAT Player-level advanced metrics
+        clutch_pts_avg = player.get("clutch_pts_avg")
+        pts_league_rank = player.get("pts_league_rank")
+        
+        # Project minutes
+        if sample_size >= 3 and l5_minutes_avg > 0:
+            proj_minutes = l5_minutes_avg
         else:
-            rank_adj = 0.0
-        adjustment_score += rank_adj
+            proj_minutes = season_minutes or l5_minutes_avg
+        
+        # Get DvP bucket for this player's position (fallback if DRtg unavailable)
+        position = str(player.get("position") or "").upper()
+        dvp_bucket = dvp_buckets.get(position)
+        if dvp_bucket is None:
+            dvp_bucket = dvp_buckets[position] = _dvp_bucket_for_position(position, dvp)
+        
+        # Track GOAT factors for output
+        goat_factors: Optional[Dict[str, Any]] = None
+        if include_factors:
+            off_rating = season.get("off_rating") or recent.get("off_rating")
+            goat_factors = {
+                "usage_pct": _safe_float(usg_pct) if usg_pct else None,
+                "ts_pct": _safe_float(ts_pct) if ts_pct else None,
+                "off_rating": _safe_float(off_rating) if off_rating else None,
+                "opp_drtg": opp_drtg_factor,
+                "opp_nrtg": opp_nrtg,
+                "clutch_ppg": _safe_float(clutch_pts_avg) if clutch_pts_avg else None,
+                "league_rank": pts_league_rank,
+                "is_starter": player.get("is_starter", False),
+                "days_rest": days_rest,
+                "dvp_bucket": dvp_bucket,
+            }
+        
+        # Calculate adjustments; missing optional metrics are passed as NaN
+        adjustment_score = _compute_adjustment_numeric(
+            season_pts,
+            l5_pts_avg,
+            l5_pts_stdev,
+            proj_minutes,
+            sample_size,
+            pace,
+            math.nan if usg_pct is None else _safe_float(usg_pct, 0.0),
+            math.nan if ts_pct is None else _safe_float(ts_pct, 0.0),
+            opp_drtg,
+            days_rest,
+            away,
+            math.nan if clutch_pts_avg is None else _safe_float(clutch_pts_avg, 0.0),
+            math.nan if pts_league_rank is None else _safe_float(pts_league_rank, math.nan),
+            DVP_CODES.get(dvp_bucket, 0),
+        )
+        
+        context = PlayerContext(
+            season_pts=season_pts,
+            l5_pts_avg=l5_pts_avg,
+            l5_minutes_avg=l5_minutes_avg,
+            proj_minutes=proj_minutes,
+            l5_stdev=l5_pts_stdev,
+        )
+        return adjustment_score, context, goat_factors
+    
+    return score
+
+
+def compute_adjustment_score(
+    player: Dict[str, Any],
+    team_data: Dict[str, Any],
+    opp_team_data: Dict[str, Any],
+    is_away: bool,
+    projected_game_pace: Optional[float],
+    include_factors: bool = True,
+) -> Tuple[float, PlayerContext, Optional[Dict[str, Any]]]:
+    """
+    Compute adjustment score for a player using GOAT All-Star logic.
     
-    return adjustment_score, proj_minutes, l5_pts_stdev, goat_factors
+    GOAT Enhanced: Prioritizes official advanced metrics (Usage%, TS%, DRtg)
+    and includes clutch scoring and league rank adjustments. For many
+    players on the same side, build the scorer once with
+    make_adjustment_scorer.
+    
+    Returns: (adjustment_score, context, goat_factors), where context holds
+    the season/L5 stats, projected minutes and L5 stdev used for scoring
+    """
+    scorer = make_adjustment_scorer(
+        team_data=team_data,
+        opp_team_data=opp_team_data,
+        is_away=is_away,
+        projected_game_pace=projected_game_pace,
+        include_factors=include_factors,
+    )
+    return scorer(player)
 
 
 def compute_adjusted_projection(
@@ -347,14 +491,54 @@ def compute_adjusted_projection(
     return round(proj_pts, 2)
 
 
+def _adjusted_projection_vec(
+    season_pts: "np.ndarray",
+    l5_pts_avg: "np.ndarray",
+    adjustment_score: "np.ndarray",
+    proj_minutes: "np.ndarray",
+    l5_minutes_avg: "np.ndarray",
+) -> "np.ndarray":
+    """
+    Vectorized compute_adjusted_projection over P players, without rounding.
+    """
+    # Baseline: 55% season + 45% L5
+    baseline = 0.55 * season_pts + 0.45 * l5_pts_avg
+    
+    # Minute scaling (1.0 when L5 minutes are unavailable)
+    minute_scale = np.divide(
+        proj_minutes, l5_minutes_avg,
+        out=np.ones_like(proj_minutes), where=l5_minutes_avg > 0,
+    )
+    np.clip(minute_scale, 0.85, 1.15, out=minute_scale)
+    
+    # Context bump from adjustment score
+    context_bump = np.clip(adjustment_score / 10.0, -0.20, 0.20)
+    
+    proj_pts = baseline * minute_scale * (1.0 + context_bump)
+    
+    # Sanity constraints
+    l5_cap = l5_pts_avg * 1.30
+    proj_pts = np.where((l5_pts_avg > 0) & (proj_pts > l5_cap), l5_cap, proj_pts)
+    proj_pts = np.where(proj_minutes < 24, proj_pts * 0.90, proj_pts)
+    
+    return proj_pts
+
+
 def run_monte_carlo(
     mean: float,
     stdev: float,
     line: float,
     iterations: int = DEFAULT_ITERATIONS,
+    exact_cdf: bool = True,
+    report_sim_mean: bool = False,
 ) -> Tuple[float, float]:
     """
-    Run Monte Carlo simulation to estimate probability of exceeding a line.
+    Estimate probability of exceeding a line under Normal(mean, stdev).
+    
+    With exact_cdf (default) the probability comes from the closed-form
+    normal CDF; otherwise it is estimated from `iterations` Monte Carlo
+    samples. simulated_mean is the model mean unless report_sim_mean asks
+    for the sample mean of the draws.
     
     Returns: (win_probability_pct, simulated_mean)
     """
@@ -363,41 +547,158 @@ def run_monte_carlo(
         # No variance - deterministic outcome
         return (100.0 if mean > line else 0.0), mean
     
+    if exact_cdf:
+        # P(X > line) = 0.5 * erfc((line - mean) / (stdev * sqrt(2)))
+        z = (line - mean) / (stdev * _SQRT2)
+        win_prob = 50.0 * math.erfc(z)
+        return round(win_prob, 1), round(mean, 2)
+    
     if HAS_NUMPY:
         # Efficient numpy simulation
-        samples = np.random.normal(mean, stdev, iterations)
-        wins = np.sum(samples > line)
-        simulated_mean = float(np.mean(samples))
+        samples = _RNG.standard_normal(iterations)
+        samples *= stdev
+        samples += mean
+        wins = np.count_nonzero(samples > line)
+        simulated_mean = float(np.mean(samples)) if report_sim_mean else mean
     else:
         # Fallback to pure Python
         samples = [random.gauss(mean, stdev) for _ in range(iterations)]
         wins = sum(1 for s in samples if s > line)
-        simulated_mean = sum(samples) / len(samples)
+        simulated_mean = sum(samples) / len(samples) if report_sim_mean else mean
     
     win_prob = (wins / iterations) * 100.0
     return round(win_prob, 1), round(simulated_mean, 2)
 
 
-def find_player_in_game_data(
-    player_name: str,
+def _qmc_normal_points(n: int, rng: Any) -> "np.ndarray":
+    """
+    n sorted quasi-random standard-normal points.
+    
+    Draws one uniform per stratum [i/n, (i+1)/n), which is what an
+    Owen-scrambled Sobol sequence gives in one dimension, and maps it
+    through the inverse normal CDF.
+    """
+    u = (np.arange(n) + rng.random(n)) / n
+    # Keep ppf finite at the ends of [0, 1)
+    np.clip(u, np.nextafter(0.0, 1.0), np.nextafter(1.0, 0.0), out=u)
+    if HAS_SCIPY:
+        return ndtri(u)
+    inv_cdf = NormalDist().inv_cdf
+    return np.array([inv_cdf(x) for x in u.tolist()])
+
+
+def run_monte_carlo_batch(
+    means: List[float],
+    stdevs: List[float],
+    lines: List[float],
+    iterations: int = DEFAULT_ITERATIONS,
+    exact_cdf: bool = True,
+    report_sim_mean: bool = False,
+    qmc: bool = False,
+    rng: Optional[Any] = None,
+) -> List[Tuple[float, float]]:
+    """
+    Vectorized run_monte_carlo over P players.
+    
+    Draws a single (P, iterations) sample matrix instead of one array per
+    player. With qmc, one set of quasi-random normal points is shared by
+    all players instead, and each win count is a binary search against
+    (line - mean) / stdev. The exact-CDF path and the no-numpy fallback
+    are already cheap per player and go through run_monte_carlo directly.
+    
+    Returns: list of (win_probability_pct, simulated_mean), one per player
+    """
+    if exact_cdf or not HAS_NUMPY or not means:
+        return [
+            run_monte_carlo(
+                m, s, l,
+                iterations=iterations,
+                exact_cdf=exact_cdf,
+                report_sim_mean=report_sim_mean,
+            )
+            for m, s, l in zip(means, stdevs, lines)
+        ]
+    
+    if rng is None:
+        rng = _RNG
+    
+    mean_arr = np.asarray(means, dtype=np.float64)
+    stdev_arr = np.asarray(stdevs, dtype=np.float64)
+    line_arr = np.asarray(lines, dtype=np.float64)
+    
+    if qmc:
+        # mean + stdev * z > line  <=>  z > (line - mean) / stdev
+        z = _qmc_normal_points(iterations, rng)
+        cutoffs = (line_arr - mean_arr) / np.where(stdev_arr > 0, stdev_arr, 1.0)
+        wins = iterations - np.searchsorted(z, cutoffs, side="right")
+        sample_means = mean_arr + stdev_arr * z.mean() if report_sim_mean else None
+    else:
+        # float32 samples halve the memory traffic of the (P, iterations)
+        # matrix; win_prob_pct only needs ~4 significant digits
+        samples = rng.standard_normal((len(means), iterations), dtype=np.float32)
+        # Scale/shift in place to avoid (P, iterations) temporaries
+        samples *= stdev_arr.astype(np.float32)[:, None]
+        samples += mean_arr.astype(np.float32)[:, None]
+        
+        wins = np.count_nonzero(samples > line_arr.astype(np.float32)[:, None], axis=1)
+        sample_means = samples.mean(axis=1, dtype=np.float64) if report_sim_mean else None
+    
+    win_probs = wins * (100.0 / iterations)
+    # E[samples] is the model mean; only reduce when asked to report it
+    simulated_means = mean_arr.copy() if sample_means is None else sample_means
+    
+    # No variance - deterministic outcome, as in run_monte_carlo
+    fixed = stdev_arr <= 0
+    if fixed.any():
+        win_probs[fixed] = np.where(mean_arr[fixed] > line_arr[fixed], 100.0, 0.0)
+        simulated_means[fixed] = mean_arr[fixed]
+    
+    return [
+        (round(float(w), 1), round(float(m), 2))
+        for w, m in zip(win_probs, simulated_means)
+    ]
+
+
+def build_player_index(
     game_data: Dict[str, Any],
-) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+) -> Dict[str, Tuple[Dict[str, Any], str]]:
     """
-    Find a player in GAME_DATA by normalized name matching.
+    Index GAME_DATA players by normalized name.
     
-    Returns: (player_dict, team_abbr) or (None, None) if not found.
+    The first occurrence of a name wins, matching a linear scan. The
+    normalized name is cached on each player dict as "_norm_name" so
+    repeated calls on the same GAME_DATA skip normalization.
+    
+    Returns: {normalized_name: (player_dict, team_abbr)}
     """
-    target_norm = _normalize_name_for_match(player_name)
+    index: Dict[str, Tuple[Dict[str, Any], str]] = {}
     
     players_by_team = game_data.get("players") or {}
     
     for team_abbr, players in players_by_team.items():
         for player in players:
-            player_name_in_data = str(player.get("name") or "")
-            if _normalize_name_for_match(player_name_in_data) == target_norm:
-                return player, team_abbr
+            norm = player.get("_norm_name")
+            if norm is None:
+                norm = _normalize_name_for_match(str(player.get("name") or ""))
+                player["_norm_name"] = norm
+            index.setdefault(norm, (player, team_abbr))
+    
+    return index
+
+
+def find_player_in_game_data(
+    player_name: str,
+    game_data: Dict[str, Any],
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Find a player in GAME_DATA by normalized name matching.
     
-    return None, None
+    For repeated lookups build the index once with build_player_index.
+    
+    Returns: (player_dict, team_abbr) or (None, None) if not found.
+    """
+    index = build_player_index(game_data)
+    return index.get(_normalize_name_for_match(player_name), (None, None))
 
 
 def simulate_game(
@@ -405,6 +706,9 @@ def simulate_game(
     baselines: Dict[str, float],
     iterations: int = DEFAULT_ITERATIONS,
     starters_only: bool = False,
+    exact_cdf: bool = True,
+    report_sim_mean: bool = False,
+    qmc: bool = False,
 ) -> List[SimulationResult]:
     """
     Run Monte Carlo simulations for all players in baselines.
@@ -414,8 +718,14 @@ def simulate_game(
     Args:
         game_data: JSON output from fetch_points_game_data.py
         baselines: Dict mapping player names to their projection lines
-        iterations: Number of Monte Carlo iterations
+        iterations: Number of Monte Carlo iterations (reported as 0 with
+            exact_cdf, which draws no samples)
         starters_only: If True, only simulate players with is_starter=True
+        exact_cdf: If True, use the closed-form normal CDF instead of sampling
+        report_sim_mean: If True (sampling only), report the sample mean of
+            the draws as simulated_mean instead of the model mean
+        qmc: If True (sampling only), use shared quasi-random normal points
+            instead of pseudo-random draws
     
     Returns: List of SimulationResult objects
     """
@@ -441,11 +751,21 @@ def simulate_game(
     else:
         projected_game_pace = None
     
-    results: List[SimulationResult] = []
+    # Per-player result fields, filled in after one batched simulation
+    pending: List[Dict[str, Any]] = []
+    projection_inputs: List[Tuple[float, float, float, float, float]] = []
+    stdevs: List[float] = []
+    lines: List[float] = []
+    
+    # Normalize every roster name once instead of once per baseline
+    player_index = build_player_index(game_data)
+    scorers: Dict[str, AdjustmentScorer] = {}
     
     for player_name, baseline_line in baselines.items():
         # Find player in game data
-        player, team_abbr = find_player_in_game_data(player_name, game_data)
+        player, team_abbr = player_index.get(
+            _normalize_name_for_match(player_name), (None, None)
+        )
         
         if player is None:
             print(f"[WARN] Player '{player_name}' not found in GAME_DATA", file=sys.stderr)
@@ -456,63 +776,73 @@ def simulate_game(
             print(f"[INFO] Skipping non-starter: {player_name}", file=sys.stderr)
             continue
         
-        # Determine team context
-        is_away = (team_abbr == away_abbr)
-        team_data = teams.get(team_abbr) or {}
-        opp_abbr = home_abbr if is_away else away_abbr
-        opp_team_data = teams.get(opp_abbr) or {}
+        # Score with this side's team context, built once per team
+        scorer = scorers.get(team_abbr)
+        if scorer is None:
+            is_away = (team_abbr == away_abbr)
+            opp_abbr = home_abbr if is_away else away_abbr
+            scorer = scorers[team_abbr] = make_adjustment_scorer(
+                team_data=teams.get(team_abbr) or {},
+                opp_team_data=teams.get(opp_abbr) or {},
+                is_away=is_away,
+                projected_game_pace=projected_game_pace,
+            )
         
         # Compute adjustment score with GOAT factors
-        adjustment_score, proj_minutes, l5_stdev, goat_factors = compute_adjustment_score(
-            player=player,
-            team_data=team_data,
-            opp_team_data=opp_team_data,
-            is_away=is_away,
-            projected_game_pace=projected_game_pace,
-        )
-        
-        # Get season and L5 stats
-        season = player.get("season") or {}
-        recent = player.get("recent") or {}
-        
-        season_pts = _safe_float(season.get("pts"), 0.0)
-        l5_pts_avg = _safe_float((recent.get("pts") or {}).get("avg"), 0.0)
-        l5_minutes_avg = _safe_float(recent.get("minutes_avg"), 0.0)
+        adjustment_score, context, goat_factors = scorer(player)
         
-        # Compute adjusted projection (mean for simulation)
-        adjusted_mean = compute_adjusted_projection(
-            season_pts=season_pts,
-            l5_pts_avg=l5_pts_avg,
-            adjustment_score=adjustment_score,
-            proj_minutes=proj_minutes,
-            l5_minutes_avg=l5_minutes_avg,
-        )
+        projection_inputs.append((
+            context.season_pts,
+            context.l5_pts_avg,
+            adjustment_score,
+            context.proj_minutes,
+            context.l5_minutes_avg,
+        ))
         
         # Use L5 stdev, with fallback to default
-        stdev = l5_stdev if l5_stdev > 0 else DEFAULT_STDEV
-        
-        # Run Monte Carlo simulation
-        win_prob, simulated_mean = run_monte_carlo(
-            mean=adjusted_mean,
-            stdev=stdev,
-            line=baseline_line,
-            iterations=iterations,
-        )
+        stdev = context.l5_stdev if context.l5_stdev > 0 else DEFAULT_STDEV
         
-        results.append(SimulationResult(
-            player_name=str(player.get("name") or player_name),
-            team=team_abbr,
-            position=str(player.get("position") or ""),
-            baseline_line=baseline_line,
-            adjusted_mean=adjusted_mean,
-            stdev=round(stdev, 2),
-            simulated_mean=simulated_mean,
-            win_prob_pct=win_prob,
-            iterations=iterations,
-            edge_pts=round(adjusted_mean - baseline_line, 2),
-            is_starter=goat_factors.get("is_starter", True),
-            goat_factors=goat_factors,
-        ))
+        pending.append({
+            "player_name": str(player.get("name") or player_name),
+            "team": team_abbr,
+            "position": str(player.get("position") or ""),
+            "baseline_line": baseline_line,
+            "stdev": round(stdev, 2),
+            "iterations": 0 if exact_cdf else iterations,
+            "is_starter": goat_factors.get("is_starter", True),
+            "goat_factors": goat_factors,
+        })
+        stdevs.append(stdev)
+        lines.append(baseline_line)
+    
+    # Compute adjusted projections (means for simulation) for all players;
+    # rounding is left to the output stage
+    if HAS_NUMPY and projection_inputs:
+        columns = np.array(projection_inputs, dtype=np.float64).T
+        means = _adjusted_projection_vec(*columns).tolist()
+    else:
+        means = [compute_adjusted_projection(*inputs) for inputs in projection_inputs]
+    
+    for fields, adjusted_mean, baseline_line in zip(pending, means, lines):
+        fields["adjusted_mean"] = adjusted_mean
+        # Edge matches the displayed (2dp) mean
+        fields["edge_pts"] = round(round(adjusted_mean, 2) - baseline_line, 2)
+    
+    # Run Monte Carlo simulation for all players at once
+    outcomes = run_monte_carlo_batch(
+        means=means,
+        stdevs=stdevs,
+        lines=lines,
+        iterations=iterations,
+        exact_cdf=exact_cdf,
+        report_sim_mean=report_sim_mean,
+        qmc=qmc,
+    )
+    
+    results: List[SimulationResult] = [
+        SimulationResult(simulated_mean=simulated_mean, win_prob_pct=win_prob, **fields)
+        for fields, (win_prob, simulated_mean) in zip(pending, outcomes)
+    ]
     
     # Sort by win probability descending
     results.sort(key=lambda r: r.win_prob_pct, reverse=True)
@@ -520,6 +850,87 @@ def simulate_game(
     return results
 
 
+def _simulate_game_worker(
+    task: Tuple[Dict[str, Any], Dict[str, float], int, bool, bool, bool, bool],
+) -> List[SimulationResult]:
+    """Pool entry point: unpack one slate task and run simulate_game."""
+    game_data, baselines, iterations, starters_only, exact_cdf, report_sim_mean, qmc = task
+    return simulate_game(
+        game_data=game_data,
+        baselines=baselines,
+        iterations=iterations,
+        starters_only=starters_only,
+        exact_cdf=exact_cdf,
+        report_sim_mean=report_sim_mean,
+        qmc=qmc,
+    )
+
+
+def simulate_slate(
+    games_and_baselines: List[Tuple[Dict[str, Any], Dict[str, float]]],
+    iterations: int = DEFAULT_ITERATIONS,
+    starters_only: bool = False,
+    exact_cdf: bool = True,
+    report_sim_mean: bool = False,
+    qmc: bool = False,
+    workers: Optional[int] = None,
+) -> List[List[SimulationResult]]:
+    """
+    Run simulate_game for every (game_data, baselines) pair of a slate.
+    
+    Games are independent, so they are spread over a process pool
+    (workers defaults to os.cpu_count()). With one worker or one game
+    everything runs in-process. Workers are spawned, not forked: forking
+    once numba's threading layer is running (e.g. points_picks' parallel
+    kernel in the same process) can deadlock, and each fresh worker seeds
+    its own _RNG.
+    
+    Returns: one result list per game, in input order
+    """
+    tasks = [
+        (game_data, baselines, iterations, starters_only, exact_cdf, report_sim_mean, qmc)
+        for game_data, baselines in games_and_baselines
+    ]
+    max_workers = min(workers or os.cpu_count() or 1, len(tasks))
+    
+    if max_workers <= 1:
+        return [_simulate_game_worker(task) for task in tasks]
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        return list(executor.map(_simulate_game_worker, tasks))
+
+
+def _read_json(path: Optional[str]) -> Any:
+    """Load JSON from a file, or from stdin when path is None."""
+    if path is None:
+        data = sys.stdin.buffer.read()
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _stream_game_data(path: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse GAME_DATA incrementally with ijson, from a file or stdin.
+    
+    Top-level sections (meta, teams, players, ...) are built as their
+    bytes arrive, so the whole document is never buffered as one string.
+    """
+    game_data: Dict[str, Any] = {}
+    if path is None:
+        for key, value in ijson.kvitems(sys.stdin.buffer, "", use_float=True):
+            game_data[key] = value
+    else:
+        with open(path, "rb") as f:
+            for key, value in ijson.kvitems(f, "", use_float=True):
+                game_data[key] = value
+    return game_data
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Monte Carlo simulation for NBA points predictions."
@@ -550,15 +961,40 @@ def main() -> None:
         action="store_true",
         help="Only simulate players marked as starters (is_starter=True)",
     )
+    parser.add_argument(
+        "--exact-cdf",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Compute win probability from the closed-form normal CDF "
+             "(default); --no-exact-cdf restores Monte Carlo sampling",
+    )
+    parser.add_argument(
+        "--report-sim-mean",
+        action="store_true",
+        help="With --no-exact-cdf, report the sample mean of the draws as "
+             "simulated_mean instead of the model mean",
+    )
+    parser.add_argument(
+        "--qmc",
+        action="store_true",
+        help="With --no-exact-cdf, use stratified quasi-random normal points "
+             "shared across players (far fewer iterations for the same accuracy)",
+    )
+    parser.add_argument(
+        "--stream-input",
+        action="store_true",
+        help="Parse GAME_DATA incrementally with ijson instead of reading it "
+             "whole (lower peak memory for large payloads)",
+    )
     args = parser.parse_args()
     
-    # Load GAME_DATA
-    if args.game_data_file:
-        with open(args.game_data_file, "r") as f:
-            game_data = json.load(f)
+    # Load GAME_DATA (from stdin if no file given)
+    if args.stream_input and HAS_IJSON:
+        game_data = _stream_game_data(args.game_data_file)
     else:
-        # Read from stdin
-        game_data = json.load(sys.stdin)
+        if args.stream_input:
+            print("[WARN] ijson not installed; reading GAME_DATA in one piece", file=sys.stderr)
+        game_data = _read_json(args.game_data_file)
     
     # Load baselines
     if args.baselines:
@@ -567,11 +1003,9 @@ def main() -> None:
             baselines = json.loads(args.baselines)
         except json.JSONDecodeError:
             # Maybe it's a file path
-            with open(args.baselines, "r") as f:
-                baselines = json.load(f)
+            baselines = _read_json(args.baselines)
     elif args.baselines_file:
-        with open(args.baselines_file, "r") as f:
-            baselines = json.load(f)
+        baselines = _read_json(args.baselines_file)
     else:
         print("Error: Must provide --baselines or --baselines-file", file=sys.stderr)
         sys.exit(1)
@@ -582,13 +1016,27 @@ def main() -> None:
         baselines=baselines,
         iterations=args.iterations,
         starters_only=args.starters_only,
+        exact_cdf=args.exact_cdf,
+        report_sim_mean=args.report_sim_mean,
+        qmc=args.qmc,
     )
     
+    if args.exact_cdf:
+        method = "exact_cdf"
+    elif args.qmc:
+        method = "qmc"
+    else:
+        method = "monte_carlo"
+    
     # Output results as JSON
     output = {
         "simulation_config": {
-            "iterations": args.iterations,
+            "method": method,
+            "iterations": 0 if args.exact_cdf else args.iterations,
             "default_stdev": DEFAULT_STDEV,
+            "exact_cdf": args.exact_cdf,
+            "report_sim_mean": args.report_sim_mean,
+            "qmc": args.qmc,
         },
         "results": [
             {
@@ -596,7 +1044,7 @@ def main() -> None:
                 "team": r.team,
                 "position": r.position,
                 "baseline_line": r.baseline_line,
-                "adjusted_mean": r.adjusted_mean,
+                "adjusted_mean": round(r.adjusted_mean, 2),
                 "stdev": r.stdev,
                 "simulated_mean": r.simulated_mean,
                 "win_prob_pct": r.win_prob_pct,
@@ -608,7 +1056,13 @@ def main() -> None:
         ],
     }
     
-    print(json.dumps(output, indent=2))
+    if HAS_ORJSON:
+        data = orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(output, indent=2).encode()
+    
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.write(b"\n")
 
 
 if __name__ == "__main__":
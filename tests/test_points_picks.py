@@ -0,0 +1,294 @@
+"""
+Regression tests for points_picks.py.
+
+Pins build_candidates output for a fixed GAME_DATA payload and checks the
+numba scoring path against the pure-Python helpers it inlines.
+"""
+
+import math
+import random
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import points_picks as pp
+
+
+def _player(name, position, season_pts, season_min, recent_min, sample, l5_avg, l5_stdev, usg, status=None):
+    return {
+        "name": name,
+        "position": position,
+        "injury_status": status,
+        "season": {"pts": season_pts, "minutes": season_min},
+        "recent": {
+            "minutes_avg": recent_min,
+            "sample_size": sample,
+            "pts": {"avg": l5_avg, "stdev": l5_stdev},
+            "usg_pct": usg,
+        },
+    }
+
+
+def make_payload(away_pace=108.0, home_pace=104.0):
+    """BOS @ MIN: away on a road back-to-back, home on two days' rest."""
+    return {
+        "meta": {"high_travel": True},
+        "teams": {
+            "BOS": {
+                "pace_last_10": away_pace,
+                "days_rest": 0,
+                "back_to_back": True,
+                "dvp": {"SG": {"bucket": "WEAK"}, "C": {"bucket": "STRONG"}},
+            },
+            "MIN": {
+                "pace_last_10": home_pace,
+                "days_rest": 2,
+                "dvp": {"PG": {"bucket": "STRONG"}, "F": {"bucket": "WEAK"}},
+            },
+        },
+        "players": {
+            "BOS": [
+                _player("Jayson Tatum", "F", 27.0, 36.0, 37.0, 5, 30.0, 4.0, 30.0),
+                _player("Jaylen Brown", "G-F", 23.0, 34.0, 33.0, 5, 20.0, 8.0, 27.0),
+                _player("Derrick White", "PG", 16.0, 33.0, 35.0, 4, 18.0, 6.0, 19.0),
+                _player("Al Horford", "C", 8.0, 26.0, 22.0, 2, 6.0, 3.0, None),
+                _player("Kristaps Porzingis", "C", 20.0, 30.0, 29.0, 5, 22.0, 5.0, 24.0, status="OUT"),
+                _player("Bench Guy", "G", 3.0, 12.0, 11.0, 5, 4.0, 2.0, 14.0),
+            ],
+            "MIN": [
+                _player("Anthony Edwards", "SG", 26.0, 36.0, 36.0, 5, 29.0, 7.5, 31.0),
+                _player("Julius Randle", "F", 20.0, 33.0, 31.0, 5, 18.0, 5.0, 25.0),
+                _player("Rudy Gobert", "C", 12.0, 32.0, 30.0, 5, 14.0, 4.0, 16.0),
+                _player("Mike Conley Jr.", "PG", 9.0, 25.0, 27.0, 3, 11.0, 3.5, None, status="GTD"),
+            ],
+        },
+    }
+
+
+# (player, proj_pts, confidence_0_100, points_outcome_score) in rank order,
+# produced by the original per-player implementation
+EXPECTED_FAST_PACE = (
+    [
+        ("Jayson Tatum", 34.02, 87, 4.641),
+        ("Al Horford", 7.73, 65, -0.536),
+        ("Jaylen Brown", 17.32, 68, -2.238),
+        ("Derrick White", 13.52, 62, -3.875),
+    ],
+    [
+        ("Mike Conley Jr.", 11.88, 82, 6.268),
+        ("Anthony Edwards", 32.82, 79, 3.62),
+        ("Julius Randle", 22.92, 83, 2.829),
+        ("Rudy Gobert", 14.34, 76, 1.119),
+    ],
+)
+EXPECTED_NO_PACE = (
+    [
+        ("Jayson Tatum", 34.02, 83, 3.056),
+        ("Al Horford", 6.82, 65, -1.65),
+        ("Jaylen Brown", 17.32, 68, -3.652),
+        ("Derrick White", 13.52, 58, -5.375),
+    ],
+    [
+        ("Mike Conley Jr.", 11.88, 82, 5.111),
+        ("Anthony Edwards", 32.82, 79, 2.077),
+        ("Julius Randle", 21.96, 83, 1.5),
+        ("Rudy Gobert", 12.69, 76, -0.167),
+    ],
+)
+
+
+def _summary(candidates):
+    return [(c.player, c.proj_pts, c.confidence_0_100, c.points_outcome_score) for c in candidates]
+
+
+def _random_rows(n, seed=7):
+    """Player inputs that hit every threshold edge of the scoring rules."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        rows.append(
+            pp._PlayerInputs(
+                player=f"Player {i}",
+                position=rnd.choice(["PG", "SG", "F", "C"]),
+                proj_minutes=rnd.choice([20.0, 24.0, 26.0, 30.0, 34.0, rnd.uniform(15, 40)]),
+                recent_minutes_avg=rnd.choice([0.0, 25.0, 30.0, rnd.uniform(10, 40)]),
+                season_pts=rnd.choice([0.0, 10.0, rnd.uniform(2, 32)]),
+                l5_pts_avg=rnd.choice([0.0, 10.0, rnd.uniform(0, 40)]),
+                l5_pts_stdev=rnd.choice([5.0, 7.0, rnd.uniform(0, 12)]),
+                usg_pct=rnd.choice([None, 20.0, 28.0, rnd.uniform(10, 35)]),
+                dvp_bucket=rnd.choice(["WEAK", "AVERAGE", "STRONG"]),
+            )
+        )
+    return rows
+
+
+class TestNormalizeName:
+    """Tests for _normalize_name_for_match."""
+    
+    def test_strips_punctuation_and_suffix(self):
+        """Test dots, commas and generational suffixes are dropped."""
+        assert pp._normalize_name_for_match("  Mike Conley Jr. ") == "mike conley"
+        assert pp._normalize_name_for_match("Gary Trent, Jr.") == "gary trent"
+        assert pp._normalize_name_for_match("P.J. Washington") == "pj washington"
+        assert pp._normalize_name_for_match("Jaren Jackson III") == "jaren jackson"
+    
+    def test_repeat_lookups_hit_cache(self):
+        """Test a repeated name is served from the lru_cache."""
+        pp._normalize_name_for_match.cache_clear()
+        pp._normalize_name_for_match("Anthony Edwards")
+        pp._normalize_name_for_match("Anthony Edwards")
+        assert pp._normalize_name_for_match.cache_info().hits == 1
+
+
+class TestScoringKernel:
+    """Tests for _score_player_kernel against the per-factor helpers."""
+    
+    @pytest.mark.parametrize("days_rest", [0, 1, 2, 3])
+    @pytest.mark.parametrize("is_away", [True, False])
+    @pytest.mark.parametrize("high_travel", [True, False])
+    def test_matches_helpers(self, days_rest, is_away, high_travel):
+        """Test the inlined kernel reproduces _score_player."""
+        for pace in (None, 95.0, 101.0, 106.0):
+            pace_factor = pp._pace_env_factor(pace)
+            for row in _random_rows(100):
+                expected = pp._score_player(row, pace_factor, days_rest, is_away, True, high_travel)
+                score, proj_pts, conf = pp._score_player_kernel(
+                    row.season_pts,
+                    row.l5_pts_avg,
+                    row.l5_pts_stdev,
+                    row.proj_minutes,
+                    row.recent_minutes_avg,
+                    pace_factor,
+                    math.nan if row.usg_pct is None else row.usg_pct,
+                    days_rest,
+                    pp._DVP_CODES.get(row.dvp_bucket, 0),
+                    is_away,
+                    high_travel,
+                )
+                assert score == pytest.approx(expected[0], abs=1e-12)
+                # _project_points rounds; the kernel leaves that to ranking
+                assert round(proj_pts, 2) == expected[1]
+                assert conf == expected[2]
+    
+    @pytest.mark.skipif(not pp.HAS_NUMBA, reason="numba not installed")
+    def test_compiled_matches_python(self):
+        """Test the njit-compiled kernel matches the Python function."""
+        rnd = random.Random(11)
+        for row in _random_rows(300):
+            args = (
+                row.season_pts,
+                row.l5_pts_avg,
+                row.l5_pts_stdev,
+                row.proj_minutes,
+                row.recent_minutes_avg,
+                rnd.choice([0.0, -1.5, 1.5]),
+                math.nan if row.usg_pct is None else row.usg_pct,
+                rnd.choice([0, 1, 2, 4]),
+                pp._DVP_CODES.get(row.dvp_bucket, 0),
+                rnd.random() < 0.5,
+                rnd.random() < 0.5,
+            )
+            compiled = pp._score_player_numba(*args)
+            python = pp._score_player_kernel(*args)
+            assert compiled[0] == pytest.approx(python[0], abs=1e-12)
+            assert compiled[1] == pytest.approx(python[1], abs=1e-12)
+            assert compiled[2] == python[2]
+
+
+class TestScoreBatch:
+    """Tests for _score_batch on the numba and pure-Python paths."""
+    
+    @pytest.mark.skipif(not pp.HAS_NUMBA, reason="numba not installed")
+    def test_numba_matches_fallback(self, monkeypatch):
+        """Test _score_all_numba scores every team like the fallback."""
+        rows = _random_rows(120, seed=3)
+        team_rows = [rows[:40], rows[40:70], [], rows[70:]]
+        context = (
+            [0, 1, 2, 3],
+            [True, False, True, False],
+            [True, False, False, True],
+            [1.5, 1.5, 0.0, -1.5],
+            [True, True, False, False],
+        )
+        
+        compiled = pp._score_batch(team_rows, *context)
+        monkeypatch.setattr(pp, "HAS_NUMBA", False)
+        fallback = pp._score_batch(team_rows, *context)
+        
+        assert [len(team) for team in compiled] == [40, 30, 0, 50]
+        for compiled_team, fallback_team in zip(compiled, fallback):
+            for c, f in zip(compiled_team, fallback_team):
+                assert c[0] == pytest.approx(f[0], abs=1e-12)
+                assert round(c[1], 2) == f[1]
+                assert c[2] == f[2]
+
+
+class TestBuildCandidates:
+    """Tests for build_candidates and score_slate."""
+    
+    @pytest.mark.parametrize("has_numba", [True, False])
+    @pytest.mark.parametrize(
+        "paces,expected",
+        [((108.0, 104.0), EXPECTED_FAST_PACE), ((None, None), EXPECTED_NO_PACE)],
+    )
+    def test_pinned_output(self, monkeypatch, has_numba, paces, expected):
+        """Test ranking, projections and confidence match the pinned baseline."""
+        if has_numba and not pp.HAS_NUMBA:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(pp, "HAS_NUMBA", has_numba)
+        
+        away, home, away_seen, home_seen = pp.build_candidates(make_payload(*paces), "BOS", "MIN")
+        
+        assert (_summary(away), _summary(home)) == expected
+        # OUT players and sub-20-minute players are dropped
+        assert away_seen == {"jayson tatum", "jaylen brown", "derrick white", "al horford"}
+        assert home_seen == {"anthony edwards", "julius randle", "rudy gobert", "mike conley"}
+    
+    def test_max_candidates_keeps_top_ranked(self):
+        """Test max_candidates materializes only the best-ranked players."""
+        away, home, _, _ = pp.build_candidates(make_payload(), "BOS", "MIN", max_candidates=2)
+        assert _summary(away) == EXPECTED_FAST_PACE[0][:2]
+        assert _summary(home) == EXPECTED_FAST_PACE[1][:2]
+    
+    def test_starter_filter(self):
+        """Test allowed names restrict candidates and bypass the minutes floor."""
+        allowed = frozenset({"al horford", "bench guy"})
+        away, _, away_seen, _ = pp.build_candidates(
+            make_payload(), "BOS", "MIN", away_allowed_norm=allowed
+        )
+        assert {c.player for c in away} == {"Al Horford", "Bench Guy"}
+        assert away_seen == allowed
+    
+    def test_slate_matches_single_games(self):
+        """Test one batched slate call equals per-game build_candidates."""
+        games = [
+            {"payload": make_payload(), "away_abbr": "BOS", "home_abbr": "MIN"},
+            {"payload": make_payload(None, None), "away_abbr": "BOS", "home_abbr": "MIN"},
+            {"payload": make_payload(96.0, None), "away_abbr": "BOS", "home_abbr": "MIN",
+             "home_allowed_norm": frozenset({"rudy gobert"})},
+        ]
+        
+        slate = pp.score_slate(games)
+        
+        assert len(slate) == len(games)
+        for game, result in zip(games, slate):
+            single = pp.build_candidates(**game)
+            assert [_summary(side) for side in result[:2]] == [_summary(side) for side in single[:2]]
+            assert result[2:] == single[2:]
+    
+    def test_slate_return_exceptions(self):
+        """Test a bad game is reported in its slot without dropping the rest."""
+        games = [
+            {"payload": {"players": 5}, "away_abbr": "BOS", "home_abbr": "MIN"},
+            {"payload": make_payload(), "away_abbr": "BOS", "home_abbr": "MIN"},
+        ]
+        
+        results = pp.score_slate(games, return_exceptions=True)
+        
+        assert isinstance(results[0], AttributeError)
+        assert (_summary(results[1][0]), _summary(results[1][1])) == EXPECTED_FAST_PACE
+        with pytest.raises(AttributeError):
+            pp.score_slate(games)
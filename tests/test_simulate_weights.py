@@ -0,0 +1,218 @@
+"""
+Regression tests for archive/simulate_weights.py.
+
+Checks the batched adjustment scores against the original per-record
+rules, the numba evaluator against the numpy fallback, and successive
+halving / grid search inside run_simulation.
+"""
+
+import dataclasses
+import random
+
+import pytest
+
+import sys
+import os
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "archive"))
+
+np = pytest.importorskip("numpy")
+sw = pytest.importorskip("simulate_weights")
+
+
+def reference_adjustment_score(record, weights):
+    """The original scalar per-record rules, kept as the reference."""
+    score = 0.0
+    if record.season_pts_avg > 0:
+        form_raw = ((record.l5_pts_avg - record.season_pts_avg) / record.season_pts_avg) * weights.form_multiplier
+        score += max(-weights.form_cap, min(weights.form_cap, form_raw))
+    if record.pace_env > 104:
+        score += weights.pace_fast
+    elif record.pace_env < 99:
+        score += weights.pace_slow
+    if record.usg_pct is not None:
+        if record.usg_pct >= 28.0:
+            score += weights.usage_high
+        elif record.usg_pct < 20.0:
+            score += weights.usage_low
+    if record.days_rest == 0:
+        score += weights.rest_b2b_road if not record.is_home else weights.rest_b2b_home
+    elif record.days_rest == 2:
+        score += weights.rest_optimal
+    elif record.days_rest >= 3:
+        score += weights.rest_rust
+    if record.dvp_bucket == "WEAK":
+        score += weights.dvp_weak
+    elif record.dvp_bucket == "STRONG":
+        score += weights.dvp_strong
+    proj_minutes = record.l5_minutes_avg if record.l5_minutes_avg > 0 else record.season_minutes_avg
+    if proj_minutes >= 34:
+        score += weights.minutes_high
+    elif proj_minutes >= 30:
+        score += weights.minutes_med
+    elif proj_minutes < 26:
+        score += weights.minutes_low
+    if record.l5_pts_stdev <= 5:
+        score += weights.consistency_stable
+    elif record.l5_pts_stdev > 7:
+        score += weights.consistency_volatile
+    return score
+
+
+def make_records(n, seed=7):
+    """Records that hit every threshold edge of the adjustment rules."""
+    rnd = random.Random(seed)
+    records = []
+    for i in range(n):
+        season = rnd.choice([0.0, rnd.uniform(2, 30)])
+        records.append(sw.PlayerGameRecord(
+            player_id=i, name=f"Player {i}", team_abbr="BOS", opponent_abbr="MIN", position="G",
+            is_home=rnd.random() < 0.5,
+            actual_pts=rnd.uniform(0, 40), actual_minutes=30.0,
+            season_pts_avg=season,
+            season_minutes_avg=rnd.choice([26.0, 30.0, 34.0, rnd.uniform(10, 38)]),
+            l5_pts_avg=rnd.uniform(0, 35),
+            l5_pts_stdev=rnd.choice([5.0, 7.0, rnd.uniform(1, 10)]),
+            l5_minutes_avg=rnd.choice([0.0, 26.0, 30.0, 34.0, rnd.uniform(10, 38)]),
+            usg_pct=rnd.choice([None, 20.0, 28.0, rnd.uniform(10, 35)]),
+            days_rest=rnd.choice([0, 1, 2, 3, 5]),
+            dvp_bucket=rnd.choice(["WEAK", "AVERAGE", "STRONG"]), dvp_rank=1,
+            pace_env=rnd.choice([99.0, 104.0, rnd.uniform(95, 108)]),
+            ts_pct=None, off_rating=None, team_drtg=None, team_nrtg=None, opp_pace=None,
+            clutch_pts_avg=None, pts_league_rank=None,
+            baseline_proj=season, prediction_error=0.0,
+        ))
+    return records
+
+
+@pytest.fixture(scope="module")
+def records():
+    return make_records(1500)
+
+
+@pytest.fixture(scope="module")
+def weight_matrix():
+    W = sw.generate_monte_carlo_configs(sw.WeightConfig(), 40, rng=np.random.default_rng(1))
+    return np.vstack((sw.weights_to_array(sw.WeightConfig()), W))
+
+
+class TestAdjustmentScores:
+    """Tests for compute_adjustment_score_with_weights."""
+    
+    def test_matches_reference_rules(self, records, weight_matrix):
+        """Test every (record, config) score equals the per-record rules."""
+        scores = sw.compute_adjustment_score_with_weights(sw.records_to_soa(records), weight_matrix)
+        
+        assert scores.shape == (len(records), len(weight_matrix))
+        for k, w in enumerate(weight_matrix):
+            weights = sw.WeightConfig(**sw.weights_from_array(w))
+            expected = [reference_adjustment_score(r, weights) for r in records]
+            np.testing.assert_allclose(scores[:, k], expected, rtol=0, atol=1e-12)
+
+
+class TestEvaluate:
+    """Tests for evaluate_split and evaluate_config."""
+    
+    def test_metrics_match_reference(self, records):
+        """Test the reported metrics match predictions from the per-record rules."""
+        weights = sw.WeightConfig()
+        result = sw.evaluate_config(weights, sw.records_to_soa(records[:1000]), sw.records_to_soa(records[1000:]))
+        
+        errors = []
+        for r in records[:1000]:
+            adj_pct = max(-0.15, min(0.15, reference_adjustment_score(r, weights) / 40.0))
+            pred = r.baseline_proj * (1.0 + adj_pct)
+            proj_minutes = r.l5_minutes_avg if r.l5_minutes_avg > 0 else r.season_minutes_avg
+            if proj_minutes < 26:
+                pred = min(pred, r.baseline_proj)
+            errors.append(pred - r.actual_pts)
+        errors = np.array(errors)
+        
+        assert result.train_metrics == {
+            "mae": round(float(np.abs(errors).mean()), 3),
+            "rmse": round(float(np.sqrt((errors ** 2).mean())), 3),
+            "bias": round(float(errors.mean()), 3),
+            "within_5_pts_pct": round(float((np.abs(errors) <= 5).mean() * 100), 2),
+            "n_players": 1000,
+        }
+    
+    @pytest.mark.skipif(not sw.HAS_NUMBA, reason="numba not installed")
+    def test_numba_matches_numpy(self, monkeypatch, records, weight_matrix):
+        """Test the numba kernel agrees with the batched numpy evaluator."""
+        soa = sw.records_to_soa(records)
+        compiled = sw.evaluate_split(weight_matrix, soa)
+        monkeypatch.setattr(sw, "HAS_NUMBA", False)
+        fallback = sw.evaluate_split(weight_matrix, soa)
+        
+        for name in ("mae", "rmse", "bias", "within_5_pts_pct"):
+            np.testing.assert_allclose(compiled[name], fallback[name], rtol=1e-12, atol=1e-12)
+
+
+class TestSearch:
+    """Tests for generate_grid_configs, run_halving and run_simulation."""
+    
+    def test_grid_configs(self):
+        """Test the grid covers every combination in product order."""
+        base = sw.WeightConfig()
+        W = sw.generate_grid_configs(base, ["pace_fast", "dvp_weak"], sw.SEARCH_SPACES)
+        
+        assert W.shape == (6 * 3, len(sw.WEIGHT_NAMES))
+        pace_fast = W[:, sw.WEIGHT_NAMES.index("pace_fast")]
+        dvp_weak = W[:, sw.WEIGHT_NAMES.index("dvp_weak")]
+        np.testing.assert_array_equal(pace_fast, np.repeat(sw.SEARCH_SPACES["pace_fast"], 3))
+        np.testing.assert_array_equal(dvp_weak, np.tile(sw.SEARCH_SPACES["dvp_weak"], 6))
+        # Factors outside the grid stay at the base config
+        np.testing.assert_array_equal(W[:, 0], base.form_multiplier)
+    
+    def test_halving_keeps_clear_winner(self, records):
+        """Test halving prunes to a sorted subset that keeps the best config."""
+        # With actual == baseline the all-zero weights predict every record
+        # exactly, so they win on any subsample
+        exact = [dataclasses.replace(r, actual_pts=r.baseline_proj) for r in records]
+        W = np.vstack((
+            np.zeros(len(sw.WEIGHT_NAMES)),
+            sw.generate_monte_carlo_configs(sw.WeightConfig(), 59, rng=np.random.default_rng(2)),
+        ))
+        
+        survivors = sw.run_halving(
+            W, sw.records_to_soa(exact), min_records=100, min_survivors=5, rng=np.random.default_rng(0)
+        )
+        
+        assert 5 <= len(survivors) < len(W)
+        assert np.all(np.diff(survivors) > 0)
+        assert 0 in survivors
+    
+    def test_halving_is_reproducible(self, records, weight_matrix):
+        """Test the same seed prunes to the same survivors."""
+        soa = sw.records_to_soa(records)
+        first = sw.run_halving(weight_matrix, soa, min_records=100, min_survivors=5, rng=np.random.default_rng(4))
+        second = sw.run_halving(weight_matrix, soa, min_records=100, min_survivors=5, rng=np.random.default_rng(4))
+        np.testing.assert_array_equal(first, second)
+    
+    @pytest.mark.parametrize("halving", [False, True])
+    def test_run_simulation_ranks_distinct_configs(self, records, halving):
+        """Test duplicate samples are ranked once and the top 10 are distinct."""
+        factors = ["pace_fast", "dvp_weak"]
+        out = sw.run_simulation(
+            records,
+            monte_carlo_samples=200,
+            optimize_factors=factors,
+            max_workers=1,
+            seed=3,
+            halving=halving,
+            grid=True,
+        )
+        summary = out["simulation_summary"]
+        
+        # 6 x 3 grid values cover every sample, the current config included
+        assert summary["sampled_configs"] == 1 + 200 + 18
+        assert summary["total_configs_tested"] <= 18
+        if not halving:
+            assert summary["total_configs_tested"] == 18
+        
+        top = [tuple(sorted(c["weights"].items())) for c in out["top_10_configs"]]
+        assert len(set(top)) == len(top) == min(10, summary["total_configs_tested"])
+        assert [c["rank"] for c in out["top_10_configs"]] == list(range(1, len(top) + 1))
+        assert 1 <= summary["current_config_rank"] <= summary["total_configs_tested"]
+        assert out["best_config"]["weights"] == out["top_10_configs"][0]["weights"]
@@ -0,0 +1,338 @@
+"""
+Regression tests for simulation_engine.py.
+
+Pins adjustment scores and projections for a fixed GAME_DATA payload,
+checks the numba adjustment kernel against its Python source, and checks
+the sampled win probabilities (pseudo-random and stratified QMC) against
+the closed-form normal CDF.
+"""
+
+import math
+import random
+from statistics import NormalDist
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulation_engine as se
+
+np = pytest.importorskip("numpy")
+
+
+def _player(name, position, is_starter, season, recent_pts, recent_min, sample,
+            clutch=None, rank=None, recent_extra=None):
+    recent = {"pts": recent_pts, "minutes_avg": recent_min, "sample_size": sample}
+    recent.update(recent_extra or {})
+    return {
+        "name": name,
+        "position": position,
+        "is_starter": is_starter,
+        "season": season,
+        "recent": recent,
+        "clutch_pts_avg": clutch,
+        "pts_league_rank": rank,
+    }
+
+
+def make_game_data(away_pace=106.0, home_pace=103.0):
+    """BOS @ MIN: MIN has a defensive rating, BOS falls back to DvP."""
+    return {
+        "meta": {"away_abbr": "BOS", "home_abbr": "MIN"},
+        "teams": {
+            "BOS": {
+                "days_rest": 0,
+                "pace_last_10": away_pace,
+                "advanced": {"defensive_rating": None, "net_rating": 4.0},
+                "dvp": {"G": {"bucket": "WEAK"}, "C": {"bucket": "STRONG"}},
+            },
+            "MIN": {
+                "days_rest": 2,
+                "pace_last_10": home_pace,
+                "advanced": {"defensive_rating": 115.0, "net_rating": -2.5},
+                "dvp": {"F": {"bucket": "STRONG"}},
+            },
+        },
+        "players": {
+            "BOS": [
+                _player("Jayson Tatum", "F", True,
+                        {"pts": 27.0, "minutes": 36.0, "usg_pct": 30.0, "ts_pct": 0.60},
+                        {"avg": 30.0, "stdev": 4.5}, 37.0, 5, clutch=3.0, rank=8),
+                _player("Jaylen Brown", "G-F", True,
+                        {"pts": 23.0, "minutes": 34.0},
+                        {"avg": 20.0, "stdev": 8.0}, 33.0, 5, rank=30,
+                        recent_extra={"usg_pct": 26.0, "ts_pct": 0.55}),
+                _player("Al Horford", "C", False,
+                        {"pts": 8.0, "minutes": 26.0},
+                        {"avg": 6.0, "stdev": None}, 22.0, 2),
+            ],
+            "MIN": [
+                _player("Anthony Edwards", "G", True,
+                        {"pts": 26.0, "minutes": 36.0, "usg_pct": 31.0, "ts_pct": 0.57},
+                        {"avg": 29.0, "stdev": 7.5}, 36.0, 5, clutch=4.5, rank=5),
+                _player("Rudy Gobert", "C", True,
+                        {"pts": 12.0, "minutes": 32.0, "usg_pct": 16.0, "ts_pct": 0.66},
+                        {"avg": 14.0, "stdev": 0}, 30.0, 5),
+                _player("Mike Conley Jr.", "G", False,
+                        {"pts": 9.0, "minutes": 25.0},
+                        {"avg": 11.0, "stdev": 3.5}, 27.0, 3, rank=120),
+            ],
+        },
+    }
+
+
+BASELINES = {
+    "Jayson Tatum": 28.5,
+    "JAYLEN BROWN": 21.5,
+    "Al Horford": 7.5,
+    "Anthony Edwards": 27.5,
+    "Rudy Gobert": 12.5,
+    "Mike Conley": 10.5,
+    "Nobody Here": 10.0,
+}
+
+# Values produced by the original if-chain implementation
+EXPECTED_ADJUSTMENT = {
+    (106.0, 103.0): {
+        "Jayson Tatum": 9.4111111111,
+        "Jaylen Brown": -1.2913043478,
+        "Al Horford": -1.925,
+        "Anthony Edwards": 9.3730769231,
+        "Rudy Gobert": 5.2166666667,
+        "Mike Conley Jr.": 8.6222222222,
+    },
+    (None, None): {
+        "Jayson Tatum": 6.7111111111,
+        "Jaylen Brown": -3.9913043478,
+        "Al Horford": -4.625,
+        "Anthony Edwards": 6.6730769231,
+        "Rudy Gobert": 2.5166666667,
+        "Mike Conley Jr.": 5.9222222222,
+    },
+}
+# player -> (adjusted_mean to 2dp, stdev, edge_pts)
+EXPECTED_PROJECTIONS = {
+    (106.0, 103.0): {
+        "Jayson Tatum": (34.02, 4.5, 5.52),
+        "Jaylen Brown": (18.85, 8.0, -2.65),
+        "Al Horford": (6.59, 6.0, -0.91),
+        "Anthony Edwards": (32.82, 7.5, 5.32),
+        "Rudy Gobert": (15.48, 6.0, 2.98),
+        "Mike Conley Jr.": (11.88, 3.5, 1.38),
+    },
+    (None, None): {
+        "Jayson Tatum": (34.02, 4.5, 5.52),
+        "Jaylen Brown": (17.32, 8.0, -4.18),
+        "Al Horford": (6.53, 6.0, -0.97),
+        "Anthony Edwards": (32.82, 7.5, 5.32),
+        "Rudy Gobert": (15.48, 6.0, 2.98),
+        "Mike Conley Jr.": (11.88, 3.5, 1.38),
+    },
+}
+
+
+def _exact_win_prob(mean, stdev, line):
+    return round(100.0 * (1.0 - NormalDist(mean, stdev).cdf(line)), 1)
+
+
+class TestAdjustmentScore:
+    """Tests for compute_adjustment_score and make_adjustment_scorer."""
+    
+    @pytest.mark.parametrize("paces", list(EXPECTED_ADJUSTMENT))
+    def test_pinned_scores(self, paces):
+        """Test adjustment scores match the pinned baseline."""
+        game_data = make_game_data(*paces)
+        teams = game_data["teams"]
+        pace = None if paces[0] is None else sum(paces) / 2
+        
+        for team, opp, is_away in (("BOS", "MIN", True), ("MIN", "BOS", False)):
+            for player in game_data["players"][team]:
+                score, _, factors = se.compute_adjustment_score(
+                    player, teams[team], teams[opp], is_away, pace
+                )
+                assert score == pytest.approx(EXPECTED_ADJUSTMENT[paces][player["name"]], abs=1e-9)
+                assert factors["is_starter"] == player["is_starter"]
+    
+    def test_scorer_without_factors(self):
+        """Test include_factors=False scores the same and skips goat_factors."""
+        game_data = make_game_data()
+        teams = game_data["teams"]
+        with_factors = se.make_adjustment_scorer(teams["BOS"], teams["MIN"], True, 104.5)
+        without = se.make_adjustment_scorer(teams["BOS"], teams["MIN"], True, 104.5, include_factors=False)
+        
+        for player in game_data["players"]["BOS"]:
+            score, context, factors = without(player)
+            assert factors is None
+            assert (score, context) == with_factors(player)[:2]
+    
+    @pytest.mark.parametrize(
+        "pace,expected",
+        [(98.0, -2.7), (98.5, 0.0), (103.9, 0.0), (104.0, 2.7)],
+    )
+    def test_pace_boundaries(self, pace, expected):
+        """Test pace is slow at <= 98 and fast at >= 104."""
+        base = (20.0, 20.0, 6.0, 30.0, 5, math.nan, math.nan, math.nan, 0.0, 1, False, math.nan, math.nan, 0)
+        args = list(base)
+        args[5] = pace
+        assert se._compute_adjustment_numeric(*args) - se._compute_adjustment_numeric(*base) == pytest.approx(expected)
+    
+    @pytest.mark.parametrize(
+        "drtg,expected",
+        [(108.0, -2.0), (110.0, -1.0), (112.0, -1.0), (113.0, 0.0), (114.0, 0.8), (118.0, 1.7)],
+    )
+    def test_drtg_boundaries(self, drtg, expected):
+        """Test opponent DRtg tiers, including the inclusive <= 108/112 edges."""
+        base = (20.0, 20.0, 6.0, 30.0, 5, math.nan, math.nan, math.nan, 0.0, 1, False, math.nan, math.nan, 0)
+        args = list(base)
+        args[8] = drtg
+        assert se._compute_adjustment_numeric(*args) - se._compute_adjustment_numeric(*base) == pytest.approx(expected)
+    
+    @pytest.mark.skipif(not se.HAS_NUMBA, reason="numba not installed")
+    def test_compiled_matches_python(self):
+        """Test the njit-compiled kernel matches its Python source."""
+        rnd = random.Random(5)
+        
+        def optional(*values):
+            return rnd.choice((math.nan,) + values)
+        
+        for _ in range(2000):
+            args = (
+                rnd.choice([0.0, 10.0, rnd.uniform(1, 35)]),
+                rnd.uniform(0, 40),
+                rnd.choice([5.0, 7.0, rnd.uniform(0, 12)]),
+                rnd.choice([26.0, 30.0, 34.0, rnd.uniform(10, 40)]),
+                rnd.choice([0, 2, 3, 5]),
+                optional(98.0, 104.0, rnd.uniform(94, 108)),
+                optional(20.0, 28.0, rnd.uniform(10, 35)),
+                optional(0.52, 0.58, 0.62, rnd.uniform(0.45, 0.68)),
+                rnd.choice([0.0, 108.0, 112.0, 114.0, 118.0, rnd.uniform(104, 122)]),
+                rnd.choice([0, 1, 2, 3]),
+                rnd.random() < 0.5,
+                optional(1.0, 2.5, 4.0, rnd.uniform(0, 6)),
+                optional(10.0, 25.0, 100.0, float(rnd.randint(1, 150))),
+                rnd.choice([-1, 0, 1]),
+            )
+            compiled = se._compute_adjustment_numeric(*args)
+            python = se._compute_adjustment_numeric.py_func(*args)
+            assert compiled == pytest.approx(python, abs=1e-12)
+
+
+class TestMonteCarlo:
+    """Tests for run_monte_carlo and run_monte_carlo_batch."""
+    
+    def test_exact_cdf_matches_normal_dist(self):
+        """Test the closed-form path matches statistics.NormalDist."""
+        for mean, stdev, line in [(25.0, 6.0, 22.5), (10.0, 3.5, 14.5), (18.2, 7.1, 18.2)]:
+            win_prob, sim_mean = se.run_monte_carlo(mean, stdev, line)
+            assert win_prob == _exact_win_prob(mean, stdev, line)
+            assert sim_mean == round(mean, 2)
+    
+    def test_zero_stdev_is_deterministic(self):
+        """Test a zero stdev gives 0% or 100% on every path."""
+        for kwargs in ({}, {"exact_cdf": False}, {"exact_cdf": False, "qmc": True}):
+            outcomes = se.run_monte_carlo_batch([20.0, 10.0], [0.0, 0.0], [15.5, 15.5], iterations=500, **kwargs)
+            assert outcomes == [(100.0, 20.0), (0.0, 10.0)]
+    
+    def test_batch_exact_matches_scalar(self):
+        """Test the batched exact path equals per-player run_monte_carlo."""
+        means, stdevs, lines = [25.0, 12.3, 30.1], [6.0, 2.5, 8.0], [22.5, 14.5, 29.5]
+        expected = [se.run_monte_carlo(m, s, l) for m, s, l in zip(means, stdevs, lines)]
+        assert se.run_monte_carlo_batch(means, stdevs, lines) == expected
+    
+    def test_sampled_batch_close_to_exact(self):
+        """Test pseudo-random sampling stays within sampling error of the CDF."""
+        means, stdevs, lines = [25.0, 12.3, 30.1], [6.0, 2.5, 8.0], [22.5, 14.5, 29.5]
+        outcomes = se.run_monte_carlo_batch(
+            means, stdevs, lines,
+            iterations=200_000,
+            exact_cdf=False,
+            report_sim_mean=True,
+            rng=np.random.default_rng(0),
+        )
+        for (win_prob, sim_mean), m, s, l in zip(outcomes, means, stdevs, lines):
+            # ~0.11 percentage points of standard error at 200k draws
+            assert win_prob == pytest.approx(_exact_win_prob(m, s, l), abs=0.6)
+            assert sim_mean == pytest.approx(m, abs=0.1)
+    
+    def test_qmc_points_are_stratified(self):
+        """Test each stratum [i/n, (i+1)/n) holds exactly one sorted point."""
+        n = 1000
+        z = se._qmc_normal_points(n, np.random.default_rng(1))
+        
+        assert np.all(np.diff(z) > 0)
+        strata = np.floor(np.array([NormalDist().cdf(x) for x in z]) * n)
+        np.testing.assert_array_equal(strata, np.arange(n))
+        assert abs(z.mean()) < 0.01
+        assert z.std() == pytest.approx(1.0, abs=0.01)
+    
+    def test_qmc_batch_close_to_exact(self):
+        """Test QMC win probabilities converge well inside MC error."""
+        means, stdevs, lines = [25.0, 12.3, 30.1, 8.0], [6.0, 2.5, 8.0, 3.0], [22.5, 14.5, 29.5, 8.0]
+        outcomes = se.run_monte_carlo_batch(
+            means, stdevs, lines,
+            iterations=10_000,
+            exact_cdf=False,
+            qmc=True,
+            rng=np.random.default_rng(2),
+        )
+        for (win_prob, sim_mean), m, s, l in zip(outcomes, means, stdevs, lines):
+            # Stratification leaves at most one point per stratum in doubt
+            assert win_prob == pytest.approx(_exact_win_prob(m, s, l), abs=0.1)
+            assert sim_mean == m
+    
+    def test_qmc_batch_reproducible(self):
+        """Test the same seed gives the same QMC estimates."""
+        args = ([25.0, 12.3], [6.0, 2.5], [22.5, 14.5])
+        first = se.run_monte_carlo_batch(*args, iterations=2000, exact_cdf=False, qmc=True,
+                                         rng=np.random.default_rng(3))
+        second = se.run_monte_carlo_batch(*args, iterations=2000, exact_cdf=False, qmc=True,
+                                          rng=np.random.default_rng(3))
+        assert first == second
+
+
+class TestSimulateGame:
+    """Tests for simulate_game and simulate_slate."""
+    
+    @pytest.mark.parametrize("paces", list(EXPECTED_PROJECTIONS))
+    def test_pinned_projections(self, paces):
+        """Test projections and edges match the pinned baseline."""
+        results = se.simulate_game(make_game_data(*paces), BASELINES)
+        
+        expected = EXPECTED_PROJECTIONS[paces]
+        assert {r.player_name for r in results} == set(expected)
+        for r in results:
+            assert (round(r.adjusted_mean, 2), r.stdev, r.edge_pts) == expected[r.player_name]
+            assert r.win_prob_pct == _exact_win_prob(r.adjusted_mean, r.stdev, r.baseline_line)
+            # No samples are drawn on the closed-form path
+            assert r.iterations == 0
+        
+        win_probs = [r.win_prob_pct for r in results]
+        assert win_probs == sorted(win_probs, reverse=True)
+    
+    def test_sampled_iterations_reported(self):
+        """Test sampling paths report the iteration count."""
+        for qmc in (False, True):
+            results = se.simulate_game(make_game_data(), BASELINES, iterations=500, exact_cdf=False, qmc=qmc)
+            assert {r.iterations for r in results} == {500}
+    
+    def test_starters_only(self):
+        """Test non-starters are skipped."""
+        results = se.simulate_game(make_game_data(), BASELINES, starters_only=True)
+        assert {r.player_name for r in results} == {
+            "Jayson Tatum", "Jaylen Brown", "Anthony Edwards", "Rudy Gobert",
+        }
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_slate_matches_single_games(self, workers):
+        """Test simulate_slate returns per-game results in input order."""
+        games = [
+            (make_game_data(), BASELINES),
+            (make_game_data(None, None), BASELINES),
+            (make_game_data(96.0, 99.0), {"Jayson Tatum": 30.5}),
+        ]
+        
+        slate = se.simulate_slate(games, workers=workers)
+        
+        assert slate == [se.simulate_game(game_data, baselines) for game_data, baselines in games]